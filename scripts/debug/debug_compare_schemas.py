@@ -1,9 +1,10 @@
-import pyarrow.parquet as pq
 from pathlib import Path
 import json
-from forklift.engine.engine import Engine
 
 def main():
+    import pyarrow.parquet as pq
+    from forklift.engine.engine import Engine
+
     golden_path = Path('tests/test-files/goodcsv/good_csv1.txt.parquet')
     print('Golden exists:', golden_path.exists())
     golden = pq.read_table(golden_path)
@@ -1,8 +1,9 @@
 import json
 from pathlib import Path
-from forklift.engine.engine import Engine
 
 def run():
+    from forklift.engine.engine import Engine
+
     data_dir = Path('tests/test-files/goodcsv')
     src = data_dir / 'good_csv1.txt'
     schema = json.loads((data_dir / 'good_csv1.json').read_text())
@@ -0,0 +1,17 @@
+path = 'tests/test-files/sql/source-sql-ddl-and-data/pg/001-sales-alt-export.sql'
+
+def main():
+    from forklift.inputs.sql_backup_input import SQLBackupInput
+
+    parser = SQLBackupInput(path)
+    ids = []
+    for t in parser.get_tables():
+        if (t['schema'], t['name']) == ('sales','good_customers'):
+            ids = sorted(r['id'] for r in t['rows'])
+            break
+    print('Count:', len(ids))
+    print('IDs:', ids)
+    print('Missing:', [i for i in range(1,21) if i not in ids])
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,9 @@
-from forklift.inputs.sql_backup_input import SQLBackupInput
-import re, os, json
+import os
 DUMP = 'tests/test-files/sql/source-sql-ddl-and-data/pg/001-sales-alt-export.sql'
 
-HEAD = re.compile(r"INSERT\s+INTO\s+sales\.good_customers", re.IGNORECASE)
-
 def main():
+    from forklift.inputs.sql_backup_input import SQLBackupInput
+
     path = os.path.abspath(DUMP)
     parser = SQLBackupInput(path)
     tables = {(t['schema'], t['name']): t for t in parser.get_tables()}
@@ -17,10 +16,8 @@ def main():
     missing = [i for i in range(1,21) if i not in ids]
     print('Missing IDs:', missing)
     print('\nRaw INSERT lines for sales.good_customers:')
-    with open(path,'r',encoding='utf-8',errors='ignore') as fh:
-        for ln in fh:
-            if HEAD.search(ln):
-                print(ln.strip())
+    for ln in parser.get_insert_lines('sales', 'good_customers'):
+        print(ln)
 
 if __name__ == '__main__':
     main()
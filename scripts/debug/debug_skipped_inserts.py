@@ -0,0 +1,16 @@
+import json
+path = 'tests/test-files/sql/source-sql-ddl-and-data/pg/001-sales-alt-export.sql'
+
+def main():
+    from forklift.inputs.sql_backup_input import SQLBackupInput
+
+    parser = SQLBackupInput(path)
+    skipped = parser._delegate.get_skipped()  # type: ignore
+    print('Total skipped:', len(skipped))
+    for s in skipped:
+        if s['schema']=='sales' and s['name']=='good_customers':
+            print('\nSkipped sales.good_customers:')
+            print(json.dumps(s, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,9 @@
-from forklift.inputs.sql_backup_input import SQLBackupInput
-from forklift.inputs.base_sql_backup_input import INSERT_RE
 import textwrap, os, json, tempfile
 
 def main():
+    from forklift.inputs.sql_backup_input import SQLBackupInput
+    from forklift.inputs.base_sql_backup_input import SINGLE_LINE_INSERT_RE
+
     sql = textwrap.dedent("""
         -- comment line should be ignored
         CREATE TABLE sch.sample (
@@ -44,13 +45,13 @@ def main():
             if not ls:
                 continue
             if ls.lower().startswith('insert into sch.types'):
-                m = INSERT_RE.search(ls)
+                m = SINGLE_LINE_INSERT_RE.match(ls)
                 print(ls)
                 print('Matched:', bool(m))
                 if m:
                     print('Groups:', m.groups())
         inp = SQLBackupInput(path)
-        tables = inp.get_tables()
+        tables = [dict(t, rows=list(t["rows"])) for t in inp.get_tables()]
         print('\n--- Parsed tables ---')
         print(json.dumps(tables, indent=2))
 
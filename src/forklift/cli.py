@@ -1,6 +1,5 @@
 from __future__ import annotations
 import argparse, json, sys
-from .engine.engine import Engine
 from . import __version__
 
 def main() -> None:
@@ -42,6 +41,8 @@ def main() -> None:
             with open(args.fwf_spec) as f:
                 opts["fwf_spec"] = json.load(f)
 
+        # Imported here so --help and usage errors skip loading Polars and the registry.
+        from .engine.engine import Engine
         eng = Engine(
             input_kind=args.input_kind,
             output_kind="parquet",
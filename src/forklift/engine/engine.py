@@ -1,14 +1,63 @@
 from __future__ import annotations
-from typing import Iterable, Any, Dict, Tuple, List
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Tuple, List
 
 from .registry import get_input_cls, get_output_cls, get_preprocessors
 from ..utils.sql_include import derive_sql_include_patterns
 from ..types import Row, RowResult
+from ..outputs.base import BaseOutput
 
 import polars as pl  # mandatory now
 
+__all__ = ["Engine"]
+
+
+def _compile_row_chain(steps: List[Tuple[str, Any]]) -> Any:
+    """Generate one straight-line function applying consecutive row preprocessors.
+
+    Each step is ``("try", try_apply)`` (returns ``(ok, row_or_error)``) or
+    ``("apply", apply)`` (may raise). The generated function returns
+    ``(ok, row, error)`` and stops at the first rejection, so a row costs one
+    Python call however long the chain is.
+
+    :param steps: Ordered ``(kind, bound_method)`` pairs.
+    :return: Callable ``chain(row) -> (ok, row, error)``.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _chain(row):"]
+    for i, (kind, fn) in enumerate(steps):
+        namespace[f"_f{i}"] = fn
+        if kind == "try":
+            lines += [
+                f"    ok, result = _f{i}(row)",
+                "    if not ok:",
+                "        return False, row, result",
+                "    row = result",
+            ]
+        else:
+            lines += [
+                "    try:",
+                f"        row = _f{i}(row)",
+                "    except Exception as exc:",
+                "        return False, row, exc",
+            ]
+    lines.append("    return True, row, None")
+    exec(compile("\n".join(lines), "<forklift-row-chain>", "exec"), namespace)
+    return namespace["_chain"]
+
 
 class Engine:
+    __slots__ = (
+        "schema", "input_opts", "output_opts",
+        "Input", "Output", "input_plugin_class", "output_plugin_class",
+        "preprocessors", "_preprocessor_chain",
+        "required", "required_field_names", "_required_tuple",
+        "dedupe_keys", "deduplication_key_fields",
+        "validator", "allow_required_nulls", "processing_chunk_size",
+        "_header_override", "_row_level_errors", "_vectorized_errors",
+    )
+
     def __init__(
             self,
             input_kind: str,
@@ -56,16 +105,46 @@ class Engine:
             self.input_opts["include"] = derive_sql_include_patterns(self.schema)
 
         self.preprocessors = get_preprocessors(preprocessors or [], schema=self.schema)
+        # Resolve the chain once so chunks don't re-dispatch via hasattr: DataFrame-level
+        # preprocessors stay separate steps, consecutive row-level ones are compiled into a
+        # single function (see :func:`_compile_row_chain`).
+        self._preprocessor_chain: Tuple[Tuple[str, Any, Any], ...] = self._resolve_preprocessor_chain()
         # Required fields collection (retain original attribute for backward compatibility)
         self.required = list(self.schema.get("required", []))
         self.required_field_names = self.required  # alias
+        self._required_tuple: Tuple[str, ...] = tuple(self.required)
         xcsv_extension_block = (self.schema.get("x-csv") or {})
+        header_config = xcsv_extension_block.get("header") or {}
+        self._header_override = header_config.get("columns") if header_config.get("mode") == "provided" else None
         dedupe_config = (xcsv_extension_block.get("dedupe") or {})
         self.dedupe_keys: Tuple[str, ...] = tuple(dedupe_config.get("keys", []) or ())
         self.deduplication_key_fields = self.dedupe_keys  # alias
         self.validator = None  # placeholder for potential future validator object
         self.allow_required_nulls = bool((xcsv_extension_block.get("nulls") or {}))
         self.processing_chunk_size = processing_chunk_size
+        self._row_level_errors: Dict[int, Exception] = {}
+        self._vectorized_errors: List[Tuple[Row, Exception]] = []
+
+    def _resolve_preprocessor_chain(self) -> Tuple[Tuple[str, Any, Any], ...]:
+        """Group preprocessors into ``("frame", fn, pre)`` and ``("rows", fn, None)`` steps.
+
+        :return: Tuple of steps in application order.
+        """
+        steps: List[Tuple[str, Any, Any]] = []
+        pending: List[Tuple[str, Any]] = []
+        for pre in self.preprocessors:
+            if hasattr(pre, "process_dataframe"):
+                if pending:
+                    steps.append(("rows", _compile_row_chain(pending), None))
+                    pending = []
+                steps.append(("frame", pre.process_dataframe, pre))
+            elif hasattr(pre, "try_apply"):
+                pending.append(("try", pre.try_apply))
+            else:
+                pending.append(("apply", pre.apply))
+        if pending:
+            steps.append(("rows", _compile_row_chain(pending), None))
+        return tuple(steps)
 
     def _required_ok(self, row: Row) -> bool:
         """Check whether required columns are satisfied.
@@ -77,115 +156,226 @@ class Engine:
         :param row: Row under evaluation.
         :return: ``True`` if row satisfies required constraints, else ``False``.
         """
-        if not self.required_field_names:
+        if not self._required_tuple:
             return True
-        for required_field_name in self.required_field_names:
+        for required_field_name in self._required_tuple:
             if required_field_name not in row:
                 # Header missing that column altogether — treated as pass.
                 continue
             required_field_value = row.get(required_field_name)
-            if required_field_value is None or (isinstance(required_field_value, str) and required_field_value.strip() == ""):
+            # ``not v or v.isspace()`` matches ``v.strip() == ""`` without allocating a stripped copy
+            if required_field_value is None or (
+                    isinstance(required_field_value, str) and (not required_field_value or required_field_value.isspace())):
                 if self.allow_required_nulls:
                     continue
                 return False
         return True
 
-    def _apply_preprocessors_dataframe(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _apply_preprocessors_dataframe(self, df: pl.DataFrame | List[Row]) -> pl.DataFrame:
         """Apply preprocessors in order on a Polars DataFrame.
 
         Row-level preprocessors (without process_dataframe) are applied by iterating rows
         then re-materializing a DataFrame to keep pipeline generic, though current design
-        expects TypeCoercion only (DataFrame path).
+        expects TypeCoercion only (DataFrame path). Consecutive row-level preprocessors
+        run as one compiled function per row and share a single round trip.
+
+        The chunk may also arrive as its raw row dicts (see :meth:`_leads_with_rows`);
+        a leading row-level step then works on copies of them, and a frame is built
+        only when a DataFrame step or the end of the chain needs one.
         """
         self._row_level_errors = {}
         self._vectorized_errors = []  # list[(row_dict, exc)] from vectorized preprocessors
-        for pre in self.preprocessors:
-            if hasattr(pre, "process_dataframe"):
-                df = pre.process_dataframe(df)  # type: ignore[attr-defined]
-                if hasattr(pre, "_df_errors"):
-                    self._vectorized_errors.extend(getattr(pre, "_df_errors"))  # type: ignore[arg-type]
-            else:
-                new_rows: List[Dict[str, Any]] = []
-                for idx, row in enumerate(df.to_dicts()):
-                    try:
-                        new_rows.append(pre.apply(row))  # type: ignore[attr-defined]
-                    except Exception as exc:
-                        new_rows.append(row)
-                        self._row_level_errors[idx] = exc
-                df = pl.DataFrame(new_rows)
-        return df
-
-    def _process_dataframe_rows(self, df: pl.DataFrame, table_name: str, seen_keys: set) -> Iterable[RowResult]:
-        # First emit vectorized errors (dropped rows)
-        if hasattr(self, "_vectorized_errors"):
-            for orig_row, exc in getattr(self, "_vectorized_errors"):
-                # ensure _table for quarantine context
-                r = dict(orig_row)
-                r["_table"] = table_name
-                yield RowResult(row=r, error=exc)
-        for idx, row in enumerate(df.to_dicts()):
-            row["_table"] = table_name
-            # If a row-level preprocessor error recorded, emit quarantine directly
-            if hasattr(self, "_row_level_errors") and idx in self._row_level_errors:
-                yield RowResult(row=row, error=self._row_level_errors[idx])
+        for kind, apply_fn, pre in self._preprocessor_chain:
+            if kind == "frame":
+                if not isinstance(df, pl.DataFrame):
+                    df = pl.DataFrame(df)
+                df = apply_fn(df)
+                df_errors = getattr(pre, "_df_errors", None)
+                if df_errors:
+                    self._vectorized_errors.extend(df_errors)
                 continue
-            try:
-                if not self._required_ok(row):
-                    raise ValueError("missing required field")
-                if self.deduplication_key_fields:
-                    key_tuple = tuple(row.get(k) for k in self.deduplication_key_fields)
-                    if key_tuple in seen_keys:
-                        row["__forklift_skip__"] = True
-                        yield RowResult(row=row, error=None)
-                        continue
-                    seen_keys.add(key_tuple)
-                yield RowResult(row=row, error=None)
-            except Exception as exc:
-                yield RowResult(row=row, error=exc)
+            rows = df.to_dicts() if isinstance(df, pl.DataFrame) else [dict(r) for r in df]
+            new_rows: List[Dict[str, Any]] = []
+            append = new_rows.append
+            for idx, row in enumerate(rows):
+                ok, row, exc = apply_fn(row)
+                append(row)
+                if not ok:
+                    self._row_level_errors[idx] = exc
+            df = new_rows
+        return df if isinstance(df, pl.DataFrame) else pl.DataFrame(df)
+
+    def _leads_with_rows(self, buffer: List[Row]) -> bool:
+        """Whether a buffered chunk can skip the frame built before preprocessing.
+
+        True when the chain starts with row-level preprocessors and every row
+        carries the same keys, so the dicts match what ``to_dicts()`` on a
+        frame built from them would return (no null-filled gaps).
+
+        :param buffer: Row dicts of the chunk.
+        :return: ``True`` if the raw rows may be handed to the chain directly.
+        """
+        chain = self._preprocessor_chain
+        if not chain or chain[0][0] != "rows":
+            return False
+        keys = buffer[0].keys()
+        return all(row.keys() == keys for row in buffer)
+
+    def _required_mask(self, df: pl.DataFrame) -> pl.Expr:
+        """Vectorized counterpart of :meth:`_required_ok` for a whole chunk.
+
+        Required columns absent from the frame pass (header-level omission is
+        tolerated); present ones fail on null or, for string columns,
+        whitespace-only values.
+
+        :param df: Chunk under evaluation.
+        :return: Boolean expression, ``True`` where the row satisfies all
+            required constraints.
+        """
+        if self.allow_required_nulls:
+            return pl.lit(True)
+        missing: List[pl.Expr] = []
+        for required_field_name in self._required_tuple:
+            if required_field_name not in df.columns:
+                continue
+            col = pl.col(required_field_name)
+            is_missing = col.is_null()
+            if df.schema[required_field_name] == pl.Utf8:
+                is_missing = is_missing | (col.str.strip_chars() == "")
+            missing.append(is_missing)
+        if not missing:
+            return pl.lit(True)
+        return ~pl.any_horizontal(missing)
+
+    def _dedupe_mask(self, df: pl.DataFrame, seen_keys: set) -> pl.Series:
+        """Flag rows whose dedupe key was already seen (in this chunk or earlier).
+
+        First occurrences within the chunk are found natively by Polars; only
+        the chunk's distinct keys cross into Python, where set operations
+        (implemented in C) test them against keys from previous chunks.
+
+        :param df: Accepted rows of the current chunk.
+        :param seen_keys: Key tuples emitted so far for this table; updated
+            in place with the chunk's distinct keys.
+        :return: Boolean Series, ``True`` for duplicate rows.
+        """
+        keys = list(self.deduplication_key_fields)
+        missing = [pl.lit(None).alias(k) for k in keys if k not in df.columns]
+        key_frame = (df.with_columns(missing) if missing else df).select(keys)
+        first = key_frame.select(pl.struct(keys).is_first_distinct()).to_series()
+        fresh = key_frame.filter(first).rows()
+        duplicate = ~first
+        if seen_keys:
+            # Only first occurrences can collide with earlier chunks; test those
+            # positionally instead of re-materializing every row's key.
+            repeated = [k in seen_keys for k in fresh]
+            if any(repeated):
+                positions = first.arg_true().filter(pl.Series(repeated, dtype=pl.Boolean))
+                duplicate = duplicate.scatter(positions, True)
+        seen_keys.update(fresh)
+        return duplicate.alias("__forklift_skip__")
+
+    def _partition_dataframe(self, df: pl.DataFrame, table_name: str,
+                             seen_keys: set) -> Tuple[pl.DataFrame, List[RowResult]]:
+        """Split a preprocessed chunk into accepted rows and quarantined results.
+
+        :param df: Chunk after :meth:`_apply_preprocessors_dataframe`.
+        :param table_name: Logical table name stamped into ``_table``.
+        :param seen_keys: Dedupe keys already emitted for this table.
+        :return: Tuple of (accepted DataFrame carrying ``_table`` and a boolean
+            ``__forklift_skip__`` column, list of rejected :class:`RowResult`).
+        """
+        rejected: List[RowResult] = []
+        # Vectorized errors (dropped rows) come first
+        for orig_row, exc in self._vectorized_errors:
+            # ensure _table for quarantine context
+            r = dict(orig_row)
+            r["_table"] = table_name
+            rejected.append(RowResult(row=r, error=exc))
+        row_level_errors = self._row_level_errors
+        ok = self._required_mask(df)
+        if row_level_errors:
+            ok = ok & ~pl.int_range(pl.len(), dtype=pl.UInt32).is_in(list(row_level_errors))
+        df = df.with_row_index("__forklift_idx__").with_columns(ok.alias("__forklift_ok__"))
+        bad = df.filter(~pl.col("__forklift_ok__"))
+        if bad.height:
+            missing_required = ValueError("missing required field")
+            bad_rows = bad.drop("__forklift_idx__", "__forklift_ok__").with_columns(
+                pl.lit(table_name, dtype=pl.Utf8).alias("_table")
+            ).to_dicts()
+            for idx, row in zip(bad.get_column("__forklift_idx__").to_list(), bad_rows):
+                # A row-level preprocessor error takes precedence over the required check
+                rejected.append(RowResult(row=row, error=row_level_errors.get(idx) or missing_required))
+            df = df.filter(pl.col("__forklift_ok__"))
+        accepted = df.drop("__forklift_idx__", "__forklift_ok__")
+        skip = self._dedupe_mask(accepted, seen_keys) if self.deduplication_key_fields else pl.lit(False)
+        accepted = accepted.with_columns(
+            pl.lit(table_name, dtype=pl.Utf8).alias("_table"),
+            skip.alias("__forklift_skip__"),
+        )
+        return accepted, rejected
+
+    def _process_chunk(self, df: pl.DataFrame | List[Row], table_name: str, seen_keys: set, output_plugin: Any) -> None:
+        """Preprocess one chunk and route its rows to the output plugin.
+
+        Accepted rows are handed over as one columnar batch via ``write_batch``;
+        outputs that lack it get :meth:`BaseOutput.write_batch`'s per-row
+        ``write`` fallback. Quarantined rows always go through the per-row
+        ``quarantine`` call.
+        """
+        df = self._apply_preprocessors_dataframe(df)
+        accepted, rejected = self._partition_dataframe(df, table_name, seen_keys)
+        quarantine = output_plugin.quarantine
+        for rr in rejected:
+            quarantine(rr)
+        write_batch = getattr(output_plugin, "write_batch", None)
+        if write_batch is None:
+            # Reuse the base class fallback so the skip-flag rule lives in one place.
+            write_batch = partial(BaseOutput.write_batch, output_plugin)
+        write_batch(accepted)
 
     def run(self, source: str, dest: str) -> None:
         """Execute ingest → preprocess → output pipeline.
 
-        Reads tables from the input plugin, augments each row with ``_table`` and
-        streams them through processing; accepted rows are written, failures are
+        Reads tables from the input plugin, buffers rows into chunks of
+        ``processing_chunk_size`` (or takes column-oriented ``batches`` of
+        that size when the table descriptor offers them) and processes each
+        chunk as a DataFrame;
+        accepted rows are written as columnar batches, failures are
         quarantined.
 
         :param source: Input location (filepath, connection string, etc.).
         :param dest: Output destination path.
         """
-        header_override = None
-        x_csv_config = (self.schema or {}).get("x-csv") or {}
-        header_config = x_csv_config.get("header") or {}
-        if header_config.get("mode") == "provided":
-            header_override = header_config.get("columns")
-
-        input_plugin = self.Input(source, header_override=header_override, **self.input_opts)
+        input_plugin = self.Input(source, header_override=self._header_override, **self.input_opts)
         output_plugin = self.Output(dest, schema=self.schema, **self.output_opts)
 
+        chunk_size = self.processing_chunk_size
+        process_chunk = self._process_chunk
+        leads_with_rows = self._leads_with_rows
         output_plugin.open()
         try:
             for table_descriptor in input_plugin.get_tables():
                 table_name = table_descriptor["name"]
-                buffer: List[Dict[str, Any]] = []
                 seen_keys: set = set()
-                for row in table_descriptor["rows"]:
-                    buffer.append(dict(row))
-                    if len(buffer) >= self.processing_chunk_size:
-                        df = pl.DataFrame(buffer)
-                        df = self._apply_preprocessors_dataframe(df)
-                        for rr in self._process_dataframe_rows(df, table_name, seen_keys):
-                            if rr.error is None:
-                                output_plugin.write(rr.row)
-                            else:
-                                output_plugin.quarantine(rr)
-                        buffer.clear()
-                if buffer:
-                    df = pl.DataFrame(buffer)
-                    df = self._apply_preprocessors_dataframe(df)
-                    for rr in self._process_dataframe_rows(df, table_name, seen_keys):
-                        if rr.error is None:
-                            output_plugin.write(rr.row)
-                        else:
-                            output_plugin.quarantine(rr)
+                batches = table_descriptor.get("batches")
+                if batches is not None:
+                    # Column-oriented input: each batch becomes a frame without row dicts.
+                    for batch in batches(chunk_size):
+                        # strict=False widens mixed columns (int + float -> Float64,
+                        # int + str -> String) the way row-dict inference does.
+                        if not isinstance(batch, pl.DataFrame):
+                            batch = pl.DataFrame(batch, strict=False)
+                        process_chunk(batch, table_name, seen_keys, output_plugin)
+                    continue
+                # Rows are sliced into chunks by islice (no per-row bytecode, no
+                # per-row copy); ``_table`` is added once per chunk as a literal column.
+                rows = iter(table_descriptor["rows"])
+                while True:
+                    buffer: List[Dict[str, Any]] = list(islice(rows, chunk_size))
+                    if not buffer:
+                        break
+                    chunk = buffer if leads_with_rows(buffer) else pl.DataFrame(buffer)
+                    process_chunk(chunk, table_name, seen_keys, output_plugin)
         finally:
             output_plugin.close()
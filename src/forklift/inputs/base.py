@@ -39,7 +39,10 @@ class BaseInput(ABC):
 
         Each descriptor must contain at least ``name`` and ``rows`` (an
         iterable / generator of row dicts). For single-file inputs (CSV, FWF)
-        this is typically a list with one element.
+        this is typically a list with one element. A descriptor may also
+        carry ``batches``: a callable taking a batch size and returning an
+        iterator of column-oriented dicts (column name -> list of values) or
+        Polars DataFrames, which the engine prefers over ``rows``.
 
         :return: List of table metadata dictionaries.
         """
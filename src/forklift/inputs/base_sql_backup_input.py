@@ -1,12 +1,60 @@
 from __future__ import annotations
-from typing import Any, Dict, Iterable, List, Tuple
+from collections import defaultdict
+from functools import lru_cache, partial
+from hashlib import blake2b
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
 from .base import BaseInput
+import mmap
 import os
 import re
+import sys
 
 # Simple single-line INSERT pattern (no multiline support by design)
 SINGLE_LINE_INSERT_RE = re.compile(r"^INSERT\s+INTO\s+([a-zA-Z0-9_\"]+)\.([a-zA-Z0-9_\"]+)\s*\(([^)]+)\)\s+VALUES\s*\((.*)\);\s*$", re.IGNORECASE)
 CREATE_TABLE_RE = re.compile(r"CREATE\s+TABLE\s+([a-zA-Z0-9_\"]+)\.([a-zA-Z0-9_\"]+)\s*\((.*?)\);", re.IGNORECASE | re.DOTALL)
+# Classifies a line by its leading keyword in one anchored pass. It is a byte pattern run
+# directly against the memory-mapped dump, so lines that are neither CREATE TABLE nor INSERT
+# are never copied out, decoded, or handed to the heavier patterns.
+STATEMENT_KIND_RE = re.compile(rb"\s*(?:(?P<create>CREATE\s+TABLE\b)|(?P<insert>INSERT\s+INTO\b))", re.IGNORECASE)
+# Byte twin of SINGLE_LINE_INSERT_RE matched in place on the map; group spans are file offsets.
+INSERT_LINE_RE = re.compile(SINGLE_LINE_INSERT_RE.pattern[1:].encode(), re.IGNORECASE)
+# One VALUES fragment per match: a quoted literal (closing quote optional for truncated
+# input), a run of unquoted characters, or a separating comma.
+VALUE_PART_RE = re.compile(r"'((?:[^']|'')*)(?:'|$)|([^',]+)|(,)")
+# First characters that can only start a numeric token (or a malformed one).
+NUMERIC_LEAD_CHARS = frozenset("0123456789+-.")
+# Characters that drive the top-level column split in a CREATE TABLE body
+CREATE_DELIMITER_RE = re.compile(r"[(),]")
+# Target table of an INSERT that SINGLE_LINE_INSERT_RE rejected (e.g. start of a multiline statement)
+INSERT_TARGET_RE = re.compile(r"INSERT\s+INTO\s+([a-zA-Z0-9_\"]+)\.([a-zA-Z0-9_\"]+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _compile_include(patterns: Tuple[str, ...]) -> Tuple[bool, FrozenSet[Tuple[str, str]], FrozenSet[str], FrozenSet[str]]:
+    """Reduce include patterns to set lookups.
+
+    :param patterns: Include patterns as passed to :meth:`BaseSQLBackupInput._matches`.
+    :return: ``(match_all, exact, schema_star, name_only)`` where ``exact`` holds
+        ``(schema, table)`` pairs, ``schema_star`` schemas from ``schema.*`` and
+        ``name_only`` bare table names.
+    """
+    exact: set = set()
+    schema_star: set = set()
+    name_only: set = set()
+    for p in patterns:
+        p = p.strip()
+        if not p:
+            continue
+        if p == "*.*":
+            return True, frozenset(), frozenset(), frozenset()
+        if p.endswith(".*"):
+            schema_star.add(p[:-2])
+        if "." in p:
+            exact.add(tuple(p.split(".", 1)))
+        else:
+            name_only.add(p)
+    return False, frozenset(exact), frozenset(schema_star), frozenset(name_only)
+
 
 class BaseSQLBackupInput(BaseInput):
     """Parse a basic SQL dump (pg_dump‑like) with only single-line INSERTs.
@@ -34,17 +82,48 @@ class BaseSQLBackupInput(BaseInput):
             )
         self._tables: Dict[Tuple[str | None, str], Dict[str, Any]] = {}
         self._parsed = False
-        self._skipped: List[dict] = []
+        # (schema, name) -> byte ranges of every INSERT line seen for that table
+        self._insert_line_index: Dict[Tuple[str | None, str], List[Tuple[int, int]]] = defaultdict(list)
+
+    def get_insert_lines(self, schema: str | None, name: str) -> List[str]:
+        """Return the raw INSERT lines targeting ``schema.name``.
+
+        Lines are located through byte offsets recorded while parsing, so only
+        those ranges are read back from the dump (no second full scan). Lines
+        that were skipped or not matched as single-line INSERTs are included.
+
+        :param schema: Schema name.
+        :param name: Table name.
+        :return: Stripped INSERT statement lines in file order.
+        """
+        if not self._parsed:
+            self._parse()
+        ranges = self._insert_line_index.get((schema, name), [])
+        lines: List[str] = []
+        with open(self.source, "rb") as fh:
+            for start, end in ranges:
+                fh.seek(start)
+                lines.append(fh.read(end - start).decode("utf-8", errors="ignore").strip())
+        return lines
 
     def get_skipped(self) -> List[dict]:
         """Return metadata for skipped INSERT statements.
 
         Each dict contains keys like ``schema``, ``name``, ``reason`` and a
-        snippet of the offending statement.
+        snippet of the offending statement. Skips are detected while rows are
+        decoded, so tables not streamed yet are scanned here first.
 
         :return: List of skipped statement descriptors.
         """
-        return list(self._skipped)
+        if not self._parsed:
+            self._parse()
+        out: List[dict] = []
+        for key, meta in self._tables.items():
+            if not meta["scanned"]:
+                for _ in self._iter_table_rows(key):
+                    pass
+            out.extend(meta["skipped"])
+        return out
 
     def iter_rows(self) -> Iterable[Dict[str, Any]]:
         """Iterate over all parsed row dictionaries across included tables.
@@ -58,17 +137,27 @@ class BaseSQLBackupInput(BaseInput):
     def get_tables(self) -> List[Dict[str, Any]]:
         """Return table descriptors matching include patterns.
 
-        Triggers lazy parsing on first call.
+        Triggers lazy indexing on first call. ``rows`` is a generator that
+        decodes the table's INSERT statements on demand, so a table is never
+        held in memory as a whole.
 
-        :return: List of dicts with keys ``schema``, ``name``, ``rows`` (list of row dicts).
+        :return: List of dicts with keys ``schema``, ``name``, ``rows`` (iterator of row dicts)
+            and ``batches`` (callable taking a batch size and returning an iterator of
+            column-oriented dicts; an alternative to ``rows``, not to be combined with it).
         """
         if not self._parsed:
             self._parse()
         out: List[Dict[str, Any]] = []
         patterns = self.include or ["*.*"]
-        for (schema, name), meta in self._tables.items():
+        for (schema, name) in self._tables:
             if self._matches(patterns, schema, name):
-                out.append({"schema": schema, "name": name, "rows": meta["rows"]})
+                key = (schema, name)
+                out.append({
+                    "schema": schema,
+                    "name": name,
+                    "rows": self._iter_table_rows(key),
+                    "batches": partial(self._iter_table_batches, key),
+                })
         return out
 
     # ---- parsing helpers ----
@@ -83,79 +172,166 @@ class BaseSQLBackupInput(BaseInput):
         :param name: Table name.
         :return: ``True`` if matched, else ``False``.
         """
-        for p in patterns:
-            p = p.strip()
-            if not p:
-                continue
-            if p == "*.*":
-                return True
-            if p.endswith(".*"):
-                if (schema or "") == p[:-2]:
-                    return True
-            if "." in p:
-                sch, tbl = p.split(".", 1)
-                if sch == (schema or "") and tbl == name:
-                    return True
-            else:
-                if name == p:
-                    return True
-        return False
-
-    def _ensure_table(self, schema: str | None, name: str, columns: List[str] | None = None):
+        # Patterns are reduced to set lookups once per distinct pattern list.
+        match_all, exact, schema_star, name_only = _compile_include(tuple(patterns))
+        if match_all:
+            return True
+        schema = schema or ""
+        return (schema, name) in exact or schema in schema_star or name in name_only
+
+    def _ensure_table(self, schema: str | None, name: str, columns: List[str] | Tuple[str, ...] | None = None):
         """Ensure a table entry exists in internal cache.
 
         :param schema: Schema name or ``None``.
         :param name: Table name.
         :param columns: Optional column list (first declaration wins).
-        :return: Table metadata dict with ``columns`` and ``rows`` keys.
+        :return: Table metadata dict with ``columns``, ``inserts`` (offsets of
+            parseable INSERT statements), ``skipped`` and ``scanned`` keys.
         """
         key = (schema, name)
         if key not in self._tables:
-            self._tables[key] = {"columns": columns[:] if columns else [], "rows": []}
+            self._tables[key] = {"columns": list(columns) if columns else [], "inserts": [], "skipped": [], "scanned": False}
         else:
             if columns and not self._tables[key]["columns"]:
-                self._tables[key]["columns"] = columns[:]
+                self._tables[key]["columns"] = list(columns)
         return self._tables[key]
 
     def _parse(self):
-        """Parse the dump file populating internal table/row structures.
+        """Index the dump file: table columns and INSERT statement offsets.
 
-        Skips unsupported statements silently; malformed INSERTs are recorded
-        in the ``_skipped`` list.
+        Values are not decoded here; :meth:`_iter_table_rows` parses them
+        lazily from the recorded offsets. Unsupported statements are ignored.
         """
-        with open(self.source, "r", encoding="utf-8", errors="ignore") as fh:
-            for raw in fh:
-                line = raw.rstrip("\n")
-                stripped = line.strip()
-                if not stripped or stripped.startswith("--"):
+        if os.path.getsize(self.source) == 0:
+            self._parsed = True
+            return
+        column_lists: Dict[bytes, Tuple[str, ...]] = {}
+        with open(self.source, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            offset = 0
+            while offset < size:
+                start = offset
+                newline = mm.find(b"\n", start)
+                offset = size if newline == -1 else newline + 1
+                kind = STATEMENT_KIND_RE.match(mm, start, offset)
+                if kind is None:
                     continue
-                if stripped.lower().startswith("create table"):
-                    self._try_create(stripped)
+                if kind.lastgroup == "create":
+                    self._try_create(mm[start:offset].decode("utf-8", errors="ignore").strip())
                     continue
-                m = SINGLE_LINE_INSERT_RE.match(stripped)
+                m = INSERT_LINE_RE.match(mm, kind.start("insert"), offset)
                 if not m:
+                    target = INSERT_TARGET_RE.match(mm[start:offset].decode("utf-8", errors="ignore").strip())
+                    if target:
+                        key = (target.group(1).replace('"', ''), target.group(2).replace('"', ''))
+                        self._insert_line_index[key].append((start, offset))
                     continue
-                schema, name, columns_blob, values_blob = m.groups()
-                schema = schema.replace('"', '')
-                name = name.replace('"', '')
-                columns = [c.strip().strip('"') for c in columns_blob.split(',')]
+                schema = m.group(1).decode("utf-8", errors="ignore").replace('"', '')
+                name = m.group(2).decode("utf-8", errors="ignore").replace('"', '')
+                self._insert_line_index[(schema, name)].append((start, offset))
+                columns_blob = m.group(3)
+                columns = column_lists.get(columns_blob)
+                if columns is None:
+                    # Interned, so every row dict of every table shares one string per column name
+                    columns = tuple(sys.intern(c.strip().strip('"')) for c in columns_blob.decode("utf-8", errors="ignore").split(','))
+                    column_lists[columns_blob] = columns
                 table_meta = self._ensure_table(schema, name, columns)
-                values = self._parse_values(values_blob)
+                table_meta["inserts"].append((start, offset, m.start(4), m.end(4), columns))
+        self._parsed = True
+
+    def _iter_table_values(self, key: Tuple[str | None, str]) -> Iterable[Tuple[Tuple[str, ...], List[Any]]]:
+        """Decode one table's INSERT statements into ``(columns, values)`` pairs on demand.
+
+        Statements whose value count differs from their column list are
+        recorded in the table's ``skipped`` list; exact duplicate rows are
+        dropped. Duplicates are detected on a 16-byte digest of the column
+        list plus the raw VALUES bytes, so the set of keys stays small however
+        large the table grows, and repeated statements are never parsed twice.
+
+        :param key: ``(schema, name)`` of an indexed table.
+        :yield: One ``(columns, values)`` pair per distinct, well-formed INSERT.
+        """
+        meta = self._tables[key]
+        schema, name = key
+        skipped: List[dict] = []
+        meta["skipped"] = skipped
+        inserts = meta["inserts"]
+        if not inserts:
+            meta["scanned"] = True
+            return
+        seen: set = set()
+        column_prefixes: Dict[Tuple[str, ...], bytes] = {}
+        with open(self.source, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start, end, values_start, values_end, columns in inserts:
+                blob = mm[values_start:values_end]
+                prefix = column_prefixes.get(columns)
+                if prefix is None:
+                    prefix = column_prefixes[columns] = "\x00".join(columns).encode("utf-8") + b"\x01"
+                row_key = blake2b(prefix + blob, digest_size=16).digest()
+                if row_key in seen:
+                    continue
+                values = self._parse_values(blob.decode("utf-8", errors="ignore"))
                 if len(values) != len(columns):
-                    self._skipped.append({
+                    skipped.append({
                         "schema": schema,
                         "name": name,
                         "reason": "len_mismatch",
                         "expected": len(columns),
                         "got": len(values),
-                        "stmt": stripped[:300]
+                        "stmt": mm[start:end].decode("utf-8", errors="ignore").strip()[:300]
                     })
                     continue
-                row = {c: v for c, v in zip(columns, values)}
-                if any(all(r.get(c) == row.get(c) for c in columns) for r in table_meta["rows"]):
-                    continue
-                table_meta["rows"].append(row)
-        self._parsed = True
+                seen.add(row_key)
+                yield columns, values
+        meta["scanned"] = True
+
+    def _iter_table_rows(self, key: Tuple[str | None, str]) -> Iterable[Dict[str, Any]]:
+        """Decode one table's INSERT statements into row dicts on demand.
+
+        :param key: ``(schema, name)`` of an indexed table.
+        :yield: One row dict per distinct, well-formed INSERT.
+        """
+        for columns, values in self._iter_table_values(key):
+            yield dict(zip(columns, values))
+
+    def _iter_table_batches(self, key: Tuple[str | None, str], batch_size: int) -> Iterable[Dict[str, List[Any]]]:
+        """Decode one table's INSERT statements into column-oriented batches.
+
+        Values are appended straight onto per-column lists, so no row dict is
+        built. Columns absent from a statement are filled with ``None``; a
+        column first seen mid-batch is back-filled with ``None``, matching how
+        a DataFrame built from row dicts lines them up.
+
+        :param key: ``(schema, name)`` of an indexed table.
+        :param batch_size: Maximum number of rows per batch.
+        :yield: Dicts mapping column name to a list of at most ``batch_size`` values.
+        """
+        data: Dict[str, List[Any]] = {}
+        height = 0
+        last_columns: Tuple[str, ...] | None = None
+        appenders: List[Any] = []
+        for columns, values in self._iter_table_values(key):
+            if columns is not last_columns:
+                # Column layout changed (or first statement of the batch): realign
+                for col in columns:
+                    if col not in data:
+                        data[col] = [None] * height
+                appenders = [data[col].append for col in columns]
+                last_columns = columns
+            for append, value in zip(appenders, values):
+                append(value)
+            height += 1
+            if len(data) != len(columns):
+                for col_values in data.values():
+                    if len(col_values) < height:
+                        col_values.append(None)
+            if height == batch_size:
+                yield data
+                data = {}
+                height = 0
+                last_columns = None
+        if height:
+            yield data
 
     def _try_create(self, stmt: str):
         """Attempt to extract column names from a CREATE TABLE statement.
@@ -171,29 +347,29 @@ class BaseSQLBackupInput(BaseInput):
         schema, name, cols_blob = m.groups()
         schema = schema.replace('"', '')
         name = name.replace('"', '')
-        col_names: List[str] = []
+        # Only parentheses and commas affect the split, so visit just those
+        # characters and slice the blob at top-level commas.
+        cuts = [-1]
         depth = 0
-        current: List[str] = []
-        for ch in cols_blob:
+        for delim in CREATE_DELIMITER_RE.finditer(cols_blob):
+            ch = delim.group()
             if ch == '(':
                 depth += 1
             elif ch == ')':
                 if depth > 0:
                     depth -= 1
-            if ch == ',' and depth == 0:
-                seg = ''.join(current).strip()
-                if seg and not seg.lower().startswith('constraint'):
-                    tok = seg.split()[0].strip('"')
-                    if tok.lower() != 'constraint':
-                        col_names.append(tok)
-                current = []
-            else:
-                current.append(ch)
-        seg = ''.join(current).strip()
-        if seg and not seg.lower().startswith('constraint'):
-            tok = seg.split()[0].strip('"')
-            if tok.lower() != 'constraint':
-                col_names.append(tok)
+            elif depth == 0:
+                cuts.append(delim.start())
+        cuts.append(len(cols_blob))
+        col_names: List[str] = []
+        for seg_start, seg_end in zip(cuts, cuts[1:]):
+            parts = cols_blob[seg_start + 1:seg_end].split(None, 1)
+            if not parts:
+                continue
+            tok = parts[0].strip('"')
+            if parts[0].lower().startswith('constraint') or tok.lower() == 'constraint':
+                continue
+            col_names.append(sys.intern(tok))
         self._ensure_table(schema, name, col_names)
 
     def _parse_values(self, blob: str) -> List[Any]:
@@ -204,32 +380,36 @@ class BaseSQLBackupInput(BaseInput):
         :param blob: Raw text inside ``VALUES(...)`` excluding leading keyword.
         :return: List of coerced Python values.
         """
+        coerce = self._coerce
+        if "'" not in blob:
+            # No string literals (e.g. all-numeric rows): every comma separates values,
+            # so a plain split replaces the tokenizer.
+            parts = blob.split(",")
+            last = parts.pop()
+            out = [coerce(part.strip()) for part in parts]
+            if last:
+                trailing = last.strip()
+                if trailing.endswith(")"):
+                    trailing = trailing[:-1].rstrip()
+                out.append(coerce(trailing))
+            return out
         out: List[Any] = []
         current: List[str] = []
-        in_string = False
-        i = 0
-        while i < len(blob):
-            ch = blob[i]
-            if ch == "'":
-                if in_string and i + 1 < len(blob) and blob[i + 1] == "'":
-                    current.append("'")
-                    i += 2
-                    continue
-                in_string = not in_string
-                i += 1
-                continue
-            if ch == ',' and not in_string:
-                out.append(self._coerce(''.join(current).strip()))
+        # Regex scanning (in C) replaces the former per-character loop; quotes are dropped
+        # and doubled quotes inside literals collapse to one, exactly as before.
+        for quoted, bare, comma in VALUE_PART_RE.findall(blob):
+            if comma:
+                out.append(coerce(''.join(current).strip()))
                 current = []
-                i += 1
-                continue
-            current.append(ch)
-            i += 1
+            elif bare:
+                current.append(bare)
+            elif quoted:
+                current.append(quoted.replace("''", "'"))
         if current:
             trailing = ''.join(current).strip()
             if trailing.endswith(")"):
                 trailing = trailing[:-1].rstrip()
-            out.append(self._coerce(trailing))
+            out.append(coerce(trailing))
         return out
 
     def _coerce(self, token: str) -> Any:
@@ -241,6 +421,27 @@ class BaseSQLBackupInput(BaseInput):
         :param token: Raw token text (sans surrounding quotes for strings).
         :return: Coerced Python value or original token.
         """
+        # Dispatch on the first character so common tokens skip checks that cannot match.
+        lead = token[:1]
+        if lead in NUMERIC_LEAD_CHARS:
+            try:
+                if '.' in token:
+                    return float(token)
+                return int(token)
+            except ValueError:
+                return token
+        if lead.isascii() and lead.isalpha():
+            # Only NULL and booleans apply; int()/float() reject anything starting with a letter
+            # except inf/nan spellings, which never contain '.' and so never reach float().
+            if lead in 'nN' and token.upper() == 'NULL':
+                return None
+            if lead in 'tTfF':
+                lowered = token.lower()
+                if lowered in ('true', 'false'):
+                    return lowered == 'true'
+            return token
+        if lead == "'" and token.endswith("'"):
+            return token[1:-1]
         if token.upper() == 'NULL':
             return None
         if token.lower() in ('true', 'false'):
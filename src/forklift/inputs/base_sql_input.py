@@ -1,4 +1,5 @@
-from typing import Any, Iterable, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
 from .base import BaseInput
 from sqlalchemy import create_engine, MetaData, inspect
 
@@ -10,7 +11,10 @@ class BaseSQLInput(BaseInput):
     :type source: str
     :param include: List of table/view patterns to include.
     :type include: List[str], optional
-    :param opts: Additional options for the input type.
+    :param opts: Additional options for the input type; ``yield_per`` sets
+        the number of rows fetched per round trip when streaming (default 1000),
+        ``discovery_workers`` the number of threads issuing per-schema metadata
+        queries (default 1, sequential).
     :type opts: Any
     """
     def __init__(self, source: str, include: List[str] = None, **opts: Any):
@@ -33,6 +37,70 @@ class BaseSQLInput(BaseInput):
             self.connection = None
         self.include = include if include is not None else ["*.*"]
         self.inspector = inspect(self.engine)
+        self._stream_batch = int(opts.get("yield_per", 1000))
+        self._discovery_workers = int(opts.get("discovery_workers", 1))
+
+    def _stream(self, selectable: Any) -> Any:
+        """
+        Execute a statement and stream its result in batches.
+
+        Uses ``yield_per`` so drivers that support it read through a
+        server-side cursor instead of buffering the whole result set.
+        Subclass ``iter_rows`` implementations should iterate this rather
+        than calling ``fetchall()``.
+
+        :param selectable: SQLAlchemy statement to execute.
+        :type selectable: Any
+        :return: Result yielding rows ``yield_per`` at a time.
+        :rtype: Any
+        """
+        return self.connection.execute(selectable, execution_options={"yield_per": self._stream_batch})
+
+    def _query_catalog(self, statement: Any, params: Dict[str, Any] = None) -> List[Tuple[str, str]]:
+        """
+        Run a catalog query returning ``(schema, name)`` rows.
+
+        Uses the shared connection when available so a single statement can
+        replace per-schema inspector round-trips.
+
+        :param statement: SQLAlchemy statement selecting schema and name columns.
+        :type statement: Any
+        :param params: Optional bind parameters.
+        :type params: Dict[str, Any], optional
+        :return: List of (schema, table/view) tuples in result order.
+        :rtype: List[Tuple[str, str]]
+        """
+        conn = self.connection or self.engine.connect()
+        try:
+            return [(row[0], row[1]) for row in conn.execute(statement, params or {})]
+        finally:
+            if conn is not self.connection:
+                conn.close()
+
+    def _get_schema_tables(self, schemas: List[str]) -> List[Tuple[str, str]]:
+        """
+        Collect tables then views for each schema through the inspector.
+
+        With ``discovery_workers`` above 1 the per-schema calls, which are
+        network round-trips, run on a thread pool; results keep schema order.
+
+        :param schemas: Schema names to inspect.
+        :type schemas: List[str]
+        :return: List of (schema, table/view) tuples.
+        :rtype: List[Tuple[str, str]]
+        """
+        def inspect_schema(schema: str) -> List[Tuple[str, str]]:
+            found = [(schema, tbl) for tbl in self.inspector.get_table_names(schema=schema)]
+            found.extend((schema, view) for view in self.inspector.get_view_names(schema=schema))
+            return found
+
+        workers = min(self._discovery_workers, len(schemas))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                per_schema = list(pool.map(inspect_schema, schemas))
+        else:
+            per_schema = map(inspect_schema, schemas)
+        return [item for found in per_schema for item in found]
 
     def _get_all_tables(self) -> List[Tuple[str, str]]:
         """
@@ -48,11 +116,7 @@ class BaseSQLInput(BaseInput):
             for view in self.inspector.get_view_names():
                 tables.append((None, view))
         else:
-            for schema in self.inspector.get_schema_names():
-                for tbl in self.inspector.get_table_names(schema=schema):
-                    tables.append((schema, tbl))
-                for view in self.inspector.get_view_names(schema=schema):
-                    tables.append((schema, view))
+            tables = self._get_schema_tables(self.inspector.get_schema_names())
         return tables
 
     def iter_rows(self) -> Iterable:
@@ -73,27 +137,25 @@ class BaseSQLInput(BaseInput):
         tables = []
         all_tables = self._get_all_tables()
         patterns = self.include if self.include is not None else ["*.*"]
-        matched = set()
+        # Reduce the patterns to set lookups once, then test each table a single time.
+        match_all = False
+        schemas = set()
+        exact = set()
+        names = set()
         for pattern in patterns:
             pattern = pattern.strip()
             if not pattern:
                 continue
             if pattern == "*.*":
-                matched.update(all_tables)
+                match_all = True
+                break
             elif ".*" in pattern:
-                schema = pattern.split(".")[0]
-                for t in all_tables:
-                    if t[0] == schema:
-                        matched.add(t)
+                schemas.add(pattern.split(".")[0])
             elif "." in pattern:
-                schema, name = pattern.split(".", 1)
-                for t in all_tables:
-                    if t[0] == schema and t[1] == name:
-                        matched.add(t)
+                exact.add(tuple(pattern.split(".", 1)))
             else:
-                for t in all_tables:
-                    if t[1] == pattern:
-                        matched.add(t)
-        for schema, name in matched:
-            tables.append({"schema": schema, "name": name, "rows": []})
+                names.add(pattern)
+        for schema, name in dict.fromkeys(map(tuple, all_tables)):
+            if match_all or schema in schemas or (schema, name) in exact or name in names:
+                tables.append({"schema": schema, "name": name, "rows": []})
         return tables
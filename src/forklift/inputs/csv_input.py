@@ -1,10 +1,16 @@
 from __future__ import annotations
+import codecs
 import csv
-from typing import Iterable, Dict, Any, List, Optional, Iterator
+import io
+import os
+from typing import Iterable, Dict, Any, List, Optional, Iterator, TYPE_CHECKING
 from .base import BaseInput
 from ..utils.detect_encoding import open_text_auto
 from ..utils.column_name_utilities import standardize_postgres_column_name, dedupe_column_names
 
+if TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+
 _PROLOGUE_PREFIXES = ("#",)
 _FOOTER_PREFIXES = ("TOTAL", "SUMMARY")
 
@@ -27,6 +33,7 @@ def _skip_prologue_lines(file_handle, header_row: Optional[List[str]] = None,
         scan limit / file length.
     """
     line_count = 0
+    header_separator_count = len(header_row) - 1 if header_row else 0
     while True:
         if max_scan_rows is not None and line_count >= max_scan_rows:
             if header_row:
@@ -43,16 +50,66 @@ def _skip_prologue_lines(file_handle, header_row: Optional[List[str]] = None,
         if not current_line_stripped or current_line_stripped.startswith(_PROLOGUE_PREFIXES):
             continue
         if header_row:
-            candidate_tokens = [cell.strip() for cell in current_line.split(",")]
-            if candidate_tokens == header_row:
+            # Counting commas rejects most candidates before any token list is built.
+            if (current_line.count(",") == header_separator_count
+                    and [cell.strip() for cell in current_line.split(",")] == header_row):
                 file_handle.seek(header_candidate_position)
                 break
-            else:
-                continue
+            continue
         file_handle.seek(header_candidate_position)
         break
 
 
+def _is_empty_cell(value: Any) -> bool:
+    """Return ``True`` for a blank CSV cell.
+
+    ``None`` and whitespace-only strings are blank; a list (e.g. overflow
+    cells) is blank when all its items are.
+    Strings are tested with ``isspace`` so no stripped copy is allocated.
+
+    :param value: Cell value as produced by the CSV reader.
+    :return: Whether the cell carries no content.
+    """
+    if value is None:
+        return True
+    if type(value) is str:
+        return not value or value.isspace()
+    if isinstance(value, list):
+        return all(map(_is_empty_cell, value))
+    return str(value).strip() == ""
+
+
+class _Utf8Recoder(io.RawIOBase):
+    """Read-only byte stream re-encoding a text handle as UTF-8.
+
+    Feeds non-UTF-8 sources to ``pyarrow.csv``, which parses UTF-8 natively;
+    its own ``ReadOptions(encoding=...)`` transcoding calls back into Python
+    codecs from Arrow threads.
+    """
+
+    def __init__(self, text_handle) -> None:
+        self._text_handle = text_handle
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            text = self._text_handle.read(io.DEFAULT_BUFFER_SIZE)
+            if not text:
+                return 0
+            self._pending = text.encode("utf-8")
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        self._text_handle.close()
+        super().close()
+
+
 def get_csv_reader(file_handle: Any, delimiter: str) -> Iterator[List[str]]:
     """Create a CSV row iterator with consistent whitespace handling.
 
@@ -68,15 +125,19 @@ def get_csv_reader(file_handle: Any, delimiter: str) -> Iterator[List[str]]:
 
 
 class CSVInput(BaseInput):
-    def _prepare_csv_reader_and_fieldnames(self, file_handle):
-        """Prepare a DictReader and deduplicated field name list.
+    def _prepare_csv_reader_and_fieldnames(self, file_handle, line_source: Optional[Iterator[str]] = None):
+        """Prepare a CSV row reader and deduplicated field name list.
 
         Determines header presence according to ``header_mode`` / overrides,
         skips any prologue lines, normalizes and deduplicates header names, and
-        returns a configured :class:`csv.DictReader` plus the final field list.
+        returns the :func:`csv.reader` positioned at the first data row plus
+        the final field list.
 
         :param file_handle: Open file handle at beginning of file.
-        :return: Tuple of (``DictReader``, ``List[str]`` field names).
+        :param line_source: Optional line iterator for the reader instead of
+            ``file_handle`` itself (e.g. ``iter(file_handle.readline, "")`` so
+            ``tell()`` stays usable after the header has been consumed).
+        :return: Tuple of (row iterator of ``List[str]``, ``List[str]`` field names).
         """
         header_mode = self.opts.get("header_mode", "auto")  # "auto", "present", "absent"
         if header_mode == "present":
@@ -92,23 +153,20 @@ class CSVInput(BaseInput):
         header_row_for_detection = header_override if has_header and header_override else None
 
         try:
-            try:
-                _skip_prologue_lines(file_handle, header_row_for_detection, header_scan_limit)
-            except ValueError:
-                if header_mode == "auto" and header_row_for_detection:
-                    file_handle.seek(0)
-                    _skip_prologue_lines(file_handle, None, header_scan_limit)
-            csv_reader = get_csv_reader(file_handle, delimiter)
+            # skip_prologue=False declares that the file starts at its header (or first data
+            # row), so the line-by-line scan is not needed.
+            if self.opts.get("skip_prologue", True):
+                try:
+                    _skip_prologue_lines(file_handle, header_row_for_detection, header_scan_limit)
+                except ValueError:
+                    if header_mode == "auto" and header_row_for_detection:
+                        file_handle.seek(0)
+                        _skip_prologue_lines(file_handle, None, header_scan_limit)
+            csv_reader = get_csv_reader(file_handle if line_source is None else line_source, delimiter)
             raw_header: List[str] = self._get_raw_header(csv_reader, has_header, header_override)
             normalized_headers = [standardize_postgres_column_name(header) for header in raw_header]
             fieldnames = dedupe_column_names(normalized_headers)
-            dict_reader = csv.DictReader(
-                file_handle if has_header else file_handle,
-                fieldnames=fieldnames,
-                delimiter=delimiter,
-                skipinitialspace=True,
-            )
-            return dict_reader, fieldnames
+            return csv_reader, fieldnames
         except Exception as e:  # pragma: no cover - defensive
             file_handle.close()
             raise e
@@ -128,35 +186,151 @@ class CSVInput(BaseInput):
         * ``header_override`` – explicit header list when file lacks one
         * ``header_mode`` – ``present`` | ``absent`` | ``auto``
         * ``header_scan_limit`` – lines to scan for a matching header
+        * ``skip_prologue`` – ``False`` when the file has no prologue lines
+          (skips the prologue scan)
+        * ``read_buffer_bytes`` – read buffer size (default 1 MiB)
+        * ``engine`` – ``"arrow"`` parses the data rows with PyArrow's
+          streaming CSV reader (see :meth:`iter_arrow_batches`)
+        * ``arrow_block_size`` – bytes per Arrow block when ``engine="arrow"``
 
         :return: Iterator of row dicts.
         """
+        if self.opts.get("engine") == "arrow":
+            for batch in self.iter_arrow_batches():
+                yield from batch.iter_rows(named=True)
+            return
         encoding_priority: List[str] = self.opts.get("encoding_priority") or ["utf-8-sig", "utf-8", "cp1252", "latin-1"]
-        file_handle = open_text_auto(self.source, encoding_priority)
+        read_buffer_bytes = int(self.opts.get("read_buffer_bytes", 1 << 20))
+        file_handle = open_text_auto(self.source, encoding_priority, read_buffer_bytes)
         try:
-            dict_reader, fieldnames = self._prepare_csv_reader_and_fieldnames(file_handle)
-            previous_row_as_tuple = None
+            csv_reader, fieldnames = self._prepare_csv_reader_and_fieldnames(file_handle)
+            field_count = len(fieldnames)
+            # Footer detection keys off the first column; an unnamed first column disables it.
             first_column_name = fieldnames[0] if fieldnames else None
-            for row_dict in dict_reader:
-                first_column_value = (row_dict.get(first_column_name) or "").strip() if first_column_name else ""
-                if any(first_column_value.startswith(footer_prefix) for footer_prefix in _FOOTER_PREFIXES):
+            previous_row_key: Optional[List[Optional[str]]] = None
+            # Module-level names used per row are bound to locals once.
+            footer_prefixes = _FOOTER_PREFIXES
+            is_empty_cell = _is_empty_cell
+            # Filters work on the positional cell list; a dict is built only for rows that are
+            # yielded, shaped like csv.DictReader's (short rows padded with None, overflow
+            # cells listed under the None key).
+            for row_values in csv_reader:
+                if not row_values:
                     continue
-                def is_empty(value):
-                    if value is None:
-                        return True
-                    if isinstance(value, list):
-                        return all(is_empty(v) for v in value)
-                    return str(value).strip() == ""
-                if not any(not is_empty(cell_value) for cell_value in row_dict.values()):
+                if first_column_name and row_values[0].strip().startswith(footer_prefixes):
                     continue
-                current_row_as_tuple = tuple((column_name, row_dict.get(column_name, "")) for column_name in fieldnames)
-                if previous_row_as_tuple is not None and current_row_as_tuple == previous_row_as_tuple:
+                if all(map(is_empty_cell, row_values)):
                     continue
-                previous_row_as_tuple = current_row_as_tuple
+                value_count = len(row_values)
+                # Well-formed rows are compared as the reader's own lists; ragged rows are
+                # first cut or padded to the header width.
+                if value_count == field_count:
+                    row_key = row_values
+                else:
+                    row_key = row_values[:field_count] + [None] * (field_count - value_count)
+                if row_key == previous_row_key:
+                    continue
+                previous_row_key = row_key
+                row_dict = dict(zip(fieldnames, row_values))
+                if value_count > field_count:
+                    row_dict[None] = row_values[field_count:]
+                elif value_count < field_count:
+                    for column_name in fieldnames[value_count:]:
+                        row_dict[column_name] = None
                 yield row_dict
         finally:
             file_handle.close()
 
+    def iter_arrow_batches(self, batch_size: Optional[int] = None) -> Iterator["pl.DataFrame"]:
+        """Yield the data rows as Polars frames parsed by ``pyarrow.csv``.
+
+        Header handling is shared with :meth:`iter_rows`; the data rows after
+        the header are then read by :func:`pyarrow.csv.open_csv` as all-string
+        columns, and the footer, blank row and consecutive duplicate filters
+        run as vectorized expressions on each batch.
+
+        Differences from the ``csv`` module path: initial spaces after a
+        delimiter are kept, and rows whose cell count differs from the header
+        raise unless they are blank or footer rows (which are dropped).
+
+        :param batch_size: Optional maximum number of rows per yielded frame;
+            by default one frame is yielded per parsed Arrow block.
+        :return: Iterator of ``pl.DataFrame`` with one string column per field.
+        """
+        import polars as pl
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        encoding_priority: List[str] = self.opts.get("encoding_priority") or ["utf-8-sig", "utf-8", "cp1252", "latin-1"]
+        file_handle = open_text_auto(self.source, encoding_priority)
+        try:
+            # Read the header line by line so tell() gives the byte offset of the first data row.
+            _, fieldnames = self._prepare_csv_reader_and_fieldnames(file_handle, iter(file_handle.readline, ""))
+            data_start = file_handle.tell()
+            encoding = file_handle.encoding
+        finally:
+            file_handle.close()
+        if not fieldnames or data_start >= os.path.getsize(self.source):
+            return
+
+        delimiter = self.opts.get("delimiter") or ","
+        first_column_name = fieldnames[0] or None
+
+        def _on_invalid_row(invalid_row) -> str:
+            text = invalid_row.text
+            if not text.replace(delimiter, "").strip():
+                return "skip"
+            if first_column_name and text.split(delimiter, 1)[0].strip().startswith(_FOOTER_PREFIXES):
+                return "skip"
+            return "error"
+
+        keep = ~pl.all_horizontal([pl.col(name).str.strip_chars() == "" for name in fieldnames])
+        if first_column_name:
+            first_column_value = pl.col(first_column_name).str.strip_chars()
+            keep = keep & ~pl.any_horizontal([first_column_value.str.starts_with(prefix) for prefix in _FOOTER_PREFIXES])
+        repeats_previous = pl.all_horizontal([pl.col(name) == pl.col(name).shift(1) for name in fieldnames]).fill_null(False)
+
+        block_size = self.opts.get("arrow_block_size")
+        read_option_overrides = {"block_size": block_size} if block_size else {}
+        if codecs.lookup(encoding).name in ("utf-8", "utf-8-sig"):
+            # Arrow decodes UTF-8 itself and skips a leading BOM.
+            data_handle = open(self.source, "rb")
+            data_handle.seek(data_start)
+        else:
+            text_handle = open(self.source, "r", encoding=encoding, newline="")
+            text_handle.seek(data_start)
+            data_handle = io.BufferedReader(_Utf8Recoder(text_handle))
+        with data_handle:
+            reader = pa_csv.open_csv(
+                data_handle,
+                read_options=pa_csv.ReadOptions(column_names=fieldnames, **read_option_overrides),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=delimiter, newlines_in_values=True, invalid_row_handler=_on_invalid_row
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in fieldnames},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+            previous_row: Optional[pl.DataFrame] = None
+            for record_batch in reader:
+                frame = pl.from_arrow(record_batch).filter(keep)
+                if frame.is_empty():
+                    continue
+                # Carry the last row of the previous batch so duplicates across batch edges are caught.
+                if previous_row is None:
+                    frame = frame.filter(~repeats_previous)
+                else:
+                    frame = pl.concat([previous_row, frame]).filter(~repeats_previous).slice(1)
+                if frame.is_empty():
+                    continue
+                previous_row = frame.tail(1)
+                if batch_size:
+                    yield from frame.iter_slices(batch_size)
+                else:
+                    yield frame
+
     def _get_raw_header(self, csv_reader: Iterator[List[str]], has_header: bool,
                         header_override: Optional[List[str]]) -> List[str]:
         """Return the raw header row (file or override).
@@ -182,9 +356,15 @@ class CSVInput(BaseInput):
     def get_tables(self) -> list[dict]:
         """Return a single logical table describing the CSV file.
 
+        With ``engine="arrow"`` the table also carries ``batches`` so the
+        engine consumes the Arrow-parsed frames without building row dicts.
+
         :return: List with one element containing ``name`` and ``rows`` iterator.
         """
-        return [{
+        table = {
             "name": self.source,
             "rows": self.iter_rows()
-        }]
+        }
+        if self.opts.get("engine") == "arrow":
+            table["batches"] = self.iter_arrow_batches
+        return [table]
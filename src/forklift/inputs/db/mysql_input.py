@@ -1,6 +1,16 @@
 from typing import List, Tuple, Iterable
+from sqlalchemy import text
 from forklift.inputs.base_sql_input import BaseSQLInput
 
+MYSQL_SYSTEM_SCHEMAS = frozenset({"information_schema", "mysql", "performance_schema", "sys"})
+# One catalog query for every schema; 'BASE TABLE' sorts before 'VIEW' like the inspector pass.
+MYSQL_TABLES_QUERY = text(
+    "SELECT table_schema, table_name FROM information_schema.tables "
+    "WHERE table_type IN ('BASE TABLE', 'VIEW') AND table_schema NOT IN ("
+    + ", ".join(f"'{schema}'" for schema in sorted(MYSQL_SYSTEM_SCHEMAS))
+    + ") ORDER BY table_schema, table_type, table_name"
+)
+
 class MySQLInput(BaseSQLInput):
     """
     MySQL-specific SQL input class. Skips system schemas when discovering tables/views.
@@ -9,19 +19,19 @@ class MySQLInput(BaseSQLInput):
         """
         Get all tables and views from non-system schemas in the MySQL database.
 
+        On MySQL a single ``information_schema.tables`` query replaces the
+        per-schema inspector calls; the inspector is the fallback.
+
         :return: List of (schema, table/view) tuples.
         :rtype: List[Tuple[str, str]]
         """
-        tables = []
-        system_schemas = {"information_schema", "mysql", "performance_schema", "sys"}
-        for schema in self.inspector.get_schema_names():
-            if schema in system_schemas:
-                continue
-            for tbl in self.inspector.get_table_names(schema=schema):
-                tables.append((schema, tbl))
-            for view in self.inspector.get_view_names(schema=schema):
-                tables.append((schema, view))
-        return tables
+        if self.engine.dialect.name == "mysql":
+            try:
+                return self._query_catalog(MYSQL_TABLES_QUERY)
+            except Exception:
+                pass
+        schemas = [schema for schema in self.inspector.get_schema_names() if schema not in MYSQL_SYSTEM_SCHEMAS]
+        return self._get_schema_tables(schemas)
 
     def iter_rows(self) -> Iterable:
         """
@@ -1,6 +1,16 @@
 from typing import List, Tuple, Iterable
+from sqlalchemy import text
 from forklift.inputs.base_sql_input import BaseSQLInput
 
+ORACLE_SYSTEM_SCHEMAS = frozenset({"SYS", "SYSTEM", "OUTLN", "XDB", "DBSNMP", "APPQOSSYS", "AUDSYS", "CTXSYS", "DVSYS", "GGSYS", "GSMADMIN_INTERNAL", "LBACSYS", "MDSYS", "OJVMSYS", "OLAPSYS", "ORDDATA", "ORDPLUGINS", "ORDSYS", "SI_INFORMTN_SCHEMA", "WMSYS", "GSMCATUSER", "GSMUSER", "GSMROOTUSER", "GSMREGUSER", "ANONYMOUS", "XS$NULL", "DIP", "APEX_040000", "APEX_050000", "APEX_180200", "APEX_210100", "APEX_220100", "FLOWS_FILES", "SPATIAL_CSW_ADMIN_USR", "SPATIAL_WFS_ADMIN_USR", "PUBLIC"})
+# Tables (kind 0) then views (kind 1) per owner, mirroring get_table_names/get_view_names.
+ORACLE_TABLES_QUERY = text(
+    "SELECT owner, table_name, 0 AS kind FROM all_tables "
+    "WHERE iot_name IS NULL AND duration IS NULL AND secondary = 'N' "
+    "UNION ALL SELECT owner, view_name, 1 AS kind FROM all_views "
+    "ORDER BY 1, 3, 2"
+)
+
 class OracleInput(BaseSQLInput):
     """
     Oracle-specific SQL input class. Skips system schemas when discovering tables/views.
@@ -9,19 +19,25 @@ class OracleInput(BaseSQLInput):
         """
         Get all tables and views from non-system schemas in the Oracle database.
 
+        On Oracle one ``all_tables``/``all_views`` query replaces the
+        per-schema inspector calls (names normalized the way the inspector
+        reports them); the inspector is the fallback.
+
         :return: List of (schema, table/view) tuples.
         :rtype: List[Tuple[str, str]]
         """
-        tables = []
-        oracle_system_schemas = {"SYS", "SYSTEM", "OUTLN", "XDB", "DBSNMP", "APPQOSSYS", "AUDSYS", "CTXSYS", "DVSYS", "GGSYS", "GSMADMIN_INTERNAL", "LBACSYS", "MDSYS", "OJVMSYS", "OLAPSYS", "ORDDATA", "ORDPLUGINS", "ORDSYS", "SI_INFORMTN_SCHEMA", "WMSYS", "GSMCATUSER", "GSMUSER", "GSMROOTUSER", "GSMREGUSER", "ANONYMOUS", "XS$NULL", "DIP", "APEX_040000", "APEX_050000", "APEX_180200", "APEX_210100", "APEX_220100", "FLOWS_FILES", "SPATIAL_CSW_ADMIN_USR", "SPATIAL_WFS_ADMIN_USR", "PUBLIC"}
-        for schema in self.inspector.get_schema_names():
-            if schema.upper() in oracle_system_schemas:
-                continue
-            for tbl in self.inspector.get_table_names(schema=schema):
-                tables.append((schema, tbl))
-            for view in self.inspector.get_view_names(schema=schema):
-                tables.append((schema, view))
-        return tables
+        if self.engine.dialect.name == "oracle":
+            try:
+                normalize = self.engine.dialect.normalize_name
+                return [
+                    (normalize(owner), normalize(name))
+                    for owner, name in self._query_catalog(ORACLE_TABLES_QUERY)
+                    if owner.upper() not in ORACLE_SYSTEM_SCHEMAS
+                ]
+            except Exception:
+                pass
+        schemas = [schema for schema in self.inspector.get_schema_names() if schema.upper() not in ORACLE_SYSTEM_SCHEMAS]
+        return self._get_schema_tables(schemas)
 
     def iter_rows(self) -> Iterable:
         """
@@ -1,5 +1,5 @@
 from typing import List, Tuple, Iterable, Any
-from sqlalchemy import Table, select
+from sqlalchemy import select
 from forklift.inputs.base_sql_input import BaseSQLInput
 
 class SQLiteInput(BaseSQLInput):
@@ -42,18 +42,27 @@ class SQLiteInput(BaseSQLInput):
 
     def iter_rows(self) -> Iterable:
         """
-        Iterate over rows from all tables/views in the SQLite database.
+        Iterate over rows from the tables/views matching the include patterns.
+
+        Tables are reflected once, in a single pass over the names not yet in
+        ``self.metadata``; later calls reuse the cached definitions.
 
         :return: An iterable of row dictionaries.
         :rtype: Iterable
         :raises Exception: If row iteration fails for a table/view.
         """
-        for schema, name in self._get_all_tables():
+        names = [table["name"] for table in self.get_tables()]
+        missing = [name for name in names if name not in self.metadata.tables]
+        if missing:
+            self.metadata.reflect(bind=self.engine, views=True, only=missing)
+        for name in names:
             try:
-                table_obj = Table(name, self.metadata, autoload_with=self.engine)
+                table_obj = self.metadata.tables[name]
                 stmt = select(table_obj)
-                result = self.connection.execute(stmt)
+                result = self._stream(stmt)
+                # Zip against the column keys fetched once; row._mapping builds a proxy per row.
+                keys = list(result.keys())
                 for row in result:
-                    yield dict(row._mapping)
+                    yield dict(zip(keys, row))
             except Exception as e:
                 raise e
@@ -1,8 +1,22 @@
+from functools import lru_cache
 from typing import List, Tuple, Iterable, Any
 from forklift.inputs.base_sql_input import BaseSQLInput
 from sqlalchemy import text
 import re
 
+# Bare odbc_connect (no '=') at a query-parameter boundary: ?odbc_connect or &odbc_connect
+BARE_ODBC_CONNECT_RE = re.compile(r'([?&])odbc_connect(?=(&|$))', re.IGNORECASE)
+# Separators between driver-style query parameters
+DRIVER_PARAM_SEPARATOR_RE = re.compile(r"[;&]")
+# Every catalog source the per-schema fallbacks consult, fetched in one round-trip
+CATALOG_OBJECTS_QUERY = """
+SELECT TABLE_SCHEMA, TABLE_NAME FROM INFORMATION_SCHEMA.VIEWS
+UNION ALL
+SELECT s.name, v.name FROM sys.views v JOIN sys.schemas s ON v.schema_id = s.schema_id
+UNION ALL
+SELECT TABLE_SCHEMA, TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE IN ('BASE TABLE', 'VIEW')
+"""
+
 class SQLServerInput(BaseSQLInput):
     """
     SQLServerInput handles SQL Server-specific quirks for connection string patching and table/view discovery.
@@ -30,26 +44,28 @@ class SQLServerInput(BaseSQLInput):
         super().__init__(patched_source, include, **opts)
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _patch_connection_string(source: str) -> str:
         """
         Patch the connection string for SQL Server to ensure SSL and correct driver settings.
         Handles both ODBC connect string and driver param styles.
+
+        The result depends only on ``source`` and is memoized, so reconnecting
+        with the same string skips the parsing; ``cache_clear()`` resets it.
         """
         lower = source.lower()
         if lower.startswith('mssql'):
             from urllib.parse import quote_plus
             default_odbc = "DRIVER=ODBC Driver 18 for SQL Server;TrustServerCertificate=yes"
-            # Bare odbc_connect (no '=') ?odbc_connect or &odbc_connect at param boundary
-            bare_pattern = r'([?&])odbc_connect(?=(&|$))'
-            if re.search(bare_pattern, source, flags=re.IGNORECASE) and 'odbc_connect=' not in lower:
+            if BARE_ODBC_CONNECT_RE.search(source) and 'odbc_connect=' not in lower:
                 encoded = quote_plus(default_odbc)
-                source = re.sub(bare_pattern,
-                                lambda m: f"{m.group(1)}odbc_connect={encoded}{m.group(2) if m.group(2)=='&' else ''}",
-                                source,
-                                flags=re.IGNORECASE)
+                source = BARE_ODBC_CONNECT_RE.sub(
+                    lambda m: f"{m.group(1)}odbc_connect={encoded}{m.group(2) if m.group(2)=='&' else ''}",
+                    source,
+                )
                 # We inserted a fully formed odbc_connect param; no further patching needed
                 return source
-            has_odbc = 'odbc_connect=' in lower or re.search(bare_pattern, lower) is not None
+            has_odbc = 'odbc_connect=' in lower or BARE_ODBC_CONNECT_RE.search(lower) is not None
             if has_odbc:
                 return SQLServerInput._patch_odbc_connect_string(source)
             if 'driver=' in lower:
@@ -103,10 +119,7 @@ class SQLServerInput(BaseSQLInput):
                 patched_parts.append("TrustServerCertificate=yes")
             return ";".join(patched_parts)
 
-        if "?" in source:
-            base_url, query_string = source.split("?", 1)
-        else:
-            base_url, query_string = source, ""
+        base_url, _, query_string = source.partition("?")
         # Robust handling: if empty query or sole/bare odbc_connect add default
         if not query_string or query_string.strip().lower() == 'odbc_connect':
             default_odbc = "DRIVER=ODBC Driver 18 for SQL Server;TrustServerCertificate=yes"
@@ -152,11 +165,8 @@ class SQLServerInput(BaseSQLInput):
         def _fix_driver_value(dval: str) -> str:
             return dval.replace("{", "").replace("}", "").replace(" ", "+")
         source = source.replace("{", "").replace("}", "")
-        if "?" in source:
-            base, query = source.split("?", 1)
-        else:
-            base, query = source, ""
-        raw_params = [p for p in re.split(r"[;&]", query) if p] if query else []
+        base, _, query = source.partition("?")
+        raw_params = [p for p in DRIVER_PARAM_SEPARATOR_RE.split(query) if p] if query else []
         new_params = []
         driver_found = False
         tsc_found = False
@@ -180,131 +190,205 @@ class SQLServerInput(BaseSQLInput):
         """
         Discover all tables and views in the database, using multiple fallbacks for SQL Server.
         Ensures all views are included, even if the driver/inspector misses some.
+        The catalog fallbacks run as one combined query; the per-schema
+        queries are only used if that query fails.
 
         :return: List of (schema, table/view) tuples.
         :rtype: List[Tuple[str, str]]
         """
         tables = []
+        # Mirrors ``tables`` so the fallbacks test membership in O(1).
+        seen = set()
         for schema in self.inspector.get_schema_names():
             for tbl in self.inspector.get_table_names(schema=schema):
                 tables.append((schema, tbl))
+                seen.add((schema, tbl))
             for view in self.inspector.get_view_names(schema=schema):
                 tables.append((schema, view))
-            if self.engine.dialect.name == "mssql":
-                self._add_views_from_information_schema(tables, schema)
-                self._add_views_from_sys_views(tables, schema)
-                self._add_tables_and_views_from_information_schema_tables(tables, schema)
+                seen.add((schema, view))
         if self.engine.dialect.name == "mssql":
-            self._add_all_views_from_sys_views(tables)
+            # One connection serves the combined query and, if needed, every fallback.
+            try:
+                conn = self.connection or self.engine.connect()
+            except Exception:
+                return tables
+            try:
+                if not self._add_objects_from_catalog(tables, seen, conn):
+                    # Each fallback runs once across all schemas; sys.views for all
+                    # schemas is what _add_all_views_from_sys_views already reads.
+                    self._add_views_from_information_schema(tables, None, seen, conn)
+                    self._add_all_views_from_sys_views(tables, seen, conn)
+                    self._add_tables_and_views_from_information_schema_tables(tables, None, seen, conn)
+            finally:
+                if conn is not self.connection:
+                    conn.close()
         return tables
 
-    def _add_views_from_information_schema(self, tables, schema):
+    def _add_objects_from_catalog(self, tables, seen=None, conn=None) -> bool:
+        """
+        Add tables and views from all catalog fallbacks with a single UNION ALL query.
+
+        Covers INFORMATION_SCHEMA.VIEWS, sys.views/sys.schemas and
+        INFORMATION_SCHEMA.TABLES for every schema in one round-trip.
+
+        :param tables: List of discovered tables/views.
+        :type tables: list
+        :param seen: Set of ``(schema, name)`` pairs already in ``tables``;
+            built from ``tables`` when omitted.
+        :type seen: set, optional
+        :param conn: Connection to run on; the caller keeps ownership. When
+            omitted the shared connection (or a temporary one) is used.
+        :type conn: Connection, optional
+        :return: ``True`` if the query ran, ``False`` if it failed and the
+            individual fallbacks should be used instead.
+        :rtype: bool
+        """
+        seen = set(tables) if seen is None else seen
+        try:
+            active_conn = conn or self.connection or self.engine.connect()
+            try:
+                result = active_conn.execute(text(CATALOG_OBJECTS_QUERY))
+                for row in result:
+                    key = (row[0], row[1])
+                    if key not in seen:
+                        seen.add(key)
+                        tables.append(key)
+            finally:
+                if active_conn is not conn and active_conn is not self.connection:
+                    active_conn.close()
+        except Exception:
+            return False
+        return True
+
+    def _add_views_from_information_schema(self, tables, schema, seen=None, conn=None):
         """
         Fallback: Add views from INFORMATION_SCHEMA.VIEWS for the given schema.
         Some drivers miss views, so this ensures they're included.
 
         :param tables: List of discovered tables/views.
         :type tables: list
-        :param schema: Schema name to query.
-        :type schema: str
+        :param schema: Schema name to query; ``None`` queries all schemas at once.
+        :type schema: str, optional
+        :param seen: Set of ``(schema, name)`` pairs already in ``tables``;
+            built from ``tables`` when omitted.
+        :type seen: set, optional
+        :param conn: Connection to run on; the caller keeps ownership. When
+            omitted the shared connection (or a temporary one) is used.
+        :type conn: Connection, optional
         """
+        seen = set(tables) if seen is None else seen
         try:
-            conn = self.connection or self.engine.connect()
+            active_conn = conn or self.connection or self.engine.connect()
             try:
-                result = conn.execute(
-                    text("SELECT TABLE_SCHEMA, TABLE_NAME FROM INFORMATION_SCHEMA.VIEWS WHERE TABLE_SCHEMA = :schema"),
-                    {"schema": schema},
-                )
+                query = "SELECT TABLE_SCHEMA, TABLE_NAME FROM INFORMATION_SCHEMA.VIEWS"
+                if schema is not None:
+                    query += " WHERE TABLE_SCHEMA = :schema"
+                result = active_conn.execute(text(query), {"schema": schema})
                 for row in result:
-                    v_schema = row[0]
-                    v_name = row[1]
-                    if (v_schema, v_name) not in tables:
-                        tables.append((v_schema, v_name))
+                    key = (row[0], row[1])
+                    if key not in seen:
+                        seen.add(key)
+                        tables.append(key)
             finally:
-                if conn is not self.connection:
-                    conn.close()
+                if active_conn is not conn and active_conn is not self.connection:
+                    active_conn.close()
         except Exception:
             pass
 
-    def _add_views_from_sys_views(self, tables, schema):
+    def _add_views_from_sys_views(self, tables, schema, seen=None, conn=None):
         """
         Fallback: Add views from sys.views/sys.schemas for the given schema.
 
         :param tables: List of discovered tables/views.
         :type tables: list
-        :param schema: Schema name to query.
-        :type schema: str
+        :param schema: Schema name to query; ``None`` queries all schemas at once.
+        :type schema: str, optional
+        :param seen: Set of ``(schema, name)`` pairs already in ``tables``;
+            built from ``tables`` when omitted.
+        :type seen: set, optional
+        :param conn: Connection to run on; the caller keeps ownership. When
+            omitted the shared connection (or a temporary one) is used.
+        :type conn: Connection, optional
         """
+        seen = set(tables) if seen is None else seen
         try:
-            conn = self.connection or self.engine.connect()
+            active_conn = conn or self.connection or self.engine.connect()
             try:
-                result = conn.execute(
-                    text(
-                        """
+                query = """
                         SELECT s.name AS schema_name, v.name AS view_name
                         FROM sys.views v
                         JOIN sys.schemas s ON v.schema_id = s.schema_id
-                        WHERE s.name = :schema
                         """
-                    ),
-                    {"schema": schema},
-                )
+                if schema is not None:
+                    query += "WHERE s.name = :schema"
+                result = active_conn.execute(text(query), {"schema": schema})
                 for row in result:
-                    v_schema = row[0]
-                    v_name = row[1]
-                    if (v_schema, v_name) not in tables:
-                        tables.append((v_schema, v_name))
+                    key = (row[0], row[1])
+                    if key not in seen:
+                        seen.add(key)
+                        tables.append(key)
             finally:
-                if conn is not self.connection:
-                    conn.close()
+                if active_conn is not conn and active_conn is not self.connection:
+                    active_conn.close()
         except Exception:
             pass
 
-    def _add_tables_and_views_from_information_schema_tables(self, tables, schema):
+    def _add_tables_and_views_from_information_schema_tables(self, tables, schema, seen=None, conn=None):
         """
         Fallback: Add both base tables and views from INFORMATION_SCHEMA.TABLES for the given schema.
 
         :param tables: List of discovered tables/views.
         :type tables: list
-        :param schema: Schema name to query.
-        :type schema: str
+        :param schema: Schema name to query; ``None`` queries all schemas at once.
+        :type schema: str, optional
+        :param seen: Set of ``(schema, name)`` pairs already in ``tables``;
+            built from ``tables`` when omitted.
+        :type seen: set, optional
+        :param conn: Connection to run on; the caller keeps ownership. When
+            omitted the shared connection (or a temporary one) is used.
+        :type conn: Connection, optional
         """
+        seen = set(tables) if seen is None else seen
         try:
-            conn = self.connection or self.engine.connect()
+            active_conn = conn or self.connection or self.engine.connect()
             try:
-                result = conn.execute(
-                    text(
-                        """
+                query = """
                         SELECT TABLE_SCHEMA, TABLE_NAME
                         FROM INFORMATION_SCHEMA.TABLES
-                        WHERE TABLE_SCHEMA = :schema
-                          AND TABLE_TYPE IN ('BASE TABLE', 'VIEW')
+                        WHERE TABLE_TYPE IN ('BASE TABLE', 'VIEW')
                         """
-                    ),
-                    {"schema": schema},
-                )
+                if schema is not None:
+                    query += "AND TABLE_SCHEMA = :schema"
+                result = active_conn.execute(text(query), {"schema": schema})
                 for row in result:
-                    t_schema = row[0]
-                    t_name = row[1]
-                    if (t_schema, t_name) not in tables:
-                        tables.append((t_schema, t_name))
+                    key = (row[0], row[1])
+                    if key not in seen:
+                        seen.add(key)
+                        tables.append(key)
             finally:
-                if conn is not self.connection:
-                    conn.close()
+                if active_conn is not conn and active_conn is not self.connection:
+                    active_conn.close()
         except Exception:
             pass
 
-    def _add_all_views_from_sys_views(self, tables):
+    def _add_all_views_from_sys_views(self, tables, seen=None, conn=None):
         """
         Fallback: Add all views across the DB from sys.views/sys.schemas.
 
         :param tables: List of discovered tables/views.
         :type tables: list
+        :param seen: Set of ``(schema, name)`` pairs already in ``tables``;
+            built from ``tables`` when omitted.
+        :type seen: set, optional
+        :param conn: Connection to run on; the caller keeps ownership. When
+            omitted the shared connection (or a temporary one) is used.
+        :type conn: Connection, optional
         """
+        seen = set(tables) if seen is None else seen
         try:
-            conn = self.connection or self.engine.connect()
+            active_conn = conn or self.connection or self.engine.connect()
             try:
-                result = conn.execute(
+                result = active_conn.execute(
                     text(
                         """
                         SELECT s.name AS schema_name, v.name AS view_name
@@ -314,13 +398,13 @@ class SQLServerInput(BaseSQLInput):
                     )
                 )
                 for row in result:
-                    v_schema = row[0]
-                    v_name = row[1]
-                    if (v_schema, v_name) not in tables:
-                        tables.append((v_schema, v_name))
+                    key = (row[0], row[1])
+                    if key not in seen:
+                        seen.add(key)
+                        tables.append(key)
             finally:
-                if conn is not self.connection:
-                    conn.close()
+                if active_conn is not conn and active_conn is not self.connection:
+                    active_conn.close()
         except Exception:
             pass
 
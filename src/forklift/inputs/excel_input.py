@@ -41,8 +41,11 @@ class ExcelInput(BaseInput):
         self.header_override = header_override
         self.opts = opts
         self.tables = tables
+        # Sheets are read on first access; ``_sheets`` maps each table name to the
+        # (sheet_name, header_override) pair used to read it.
+        self._sheets: dict[str, tuple[Optional[str], Optional[list[str]]]] = {}
         self._dfs: dict[str, pl.DataFrame] = {}
-        self._load_excel_multi()
+        self._register_sheets()
 
     # ---------------------- Loading ----------------------
     def _read_sheet(self, sheet_name: Optional[str], header_override: Optional[list[str]]) -> pl.DataFrame:
@@ -73,36 +76,58 @@ class ExcelInput(BaseInput):
             df.columns = dedupe_column_names([str(c) for c in df.columns])  # type: ignore[attr-defined]
         return df
 
-    def _load_excel_multi(self) -> None:
+    def _register_sheets(self) -> None:
         if self.tables:
             for table in self.tables:
                 sheet_name = table.get("name")
                 if sheet_name is None:
                     raise ValueError("Table definition missing 'name' for Excel sheet")
-                header_override = table.get("header_override")
-                self._dfs[sheet_name] = self._read_sheet(sheet_name, header_override)
+                self._sheets[sheet_name] = (sheet_name, table.get("header_override"))
         else:
             sheet_name = self.opts.get("sheet_name")
-            self._dfs[sheet_name or "default"] = self._read_sheet(sheet_name, self.header_override)
+            self._sheets[sheet_name or "default"] = (sheet_name, self.header_override)
+
+    def _load_sheet(self, table_name: str) -> Optional[pl.DataFrame]:
+        """Return the DataFrame for ``table_name``, reading the sheet on first use."""
+        df = self._dfs.get(table_name)
+        if df is None and table_name in self._sheets:
+            sheet_name, header_override = self._sheets[table_name]
+            df = self._dfs[table_name] = self._read_sheet(sheet_name, header_override)
+        return df
 
     # ---------------------- Iteration ----------------------
     def _iter_dataframe_rows(self, df: pl.DataFrame) -> Iterable[Dict[str, Any]]:
-        for row in df.iter_rows(named=True):  # type: ignore[attr-defined]
-            yield dict(row)
+        # iter_rows(named=True) already builds a fresh dict per row; no copy needed.
+        yield from df.iter_rows(named=True)  # type: ignore[attr-defined]
+
+    def _iter_sheet_rows(self, table_name: str) -> Iterable[Dict[str, Any]]:
+        df = self._load_sheet(table_name)
+        if df is not None:
+            yield from self._iter_dataframe_rows(df)
+
+    def _iter_sheet_batches(self, table_name: str, n_rows: int = 10000) -> Iterable[pl.DataFrame]:
+        df = self._load_sheet(table_name)
+        if df is not None:
+            yield from df.iter_slices(n_rows)  # type: ignore[attr-defined]
 
     def iter_rows(self, table_name: Optional[str] = None) -> Iterable[Dict[str, Any]]:
         if table_name:
-            df = self._dfs.get(table_name)
-            if df is not None:
-                yield from self._iter_dataframe_rows(df)
+            yield from self._iter_sheet_rows(table_name)
         else:
-            for tname, df in self._dfs.items():
-                for row in self._iter_dataframe_rows(df):
+            for tname in self._sheets:
+                for row in self._iter_sheet_rows(tname):
                     row["_table"] = tname
                     yield row
 
     def get_tables(self) -> list[dict]:
+        # Both entries read their sheet only when first consumed. ``batches`` hands
+        # the engine zero-copy slices of the loaded sheet, so it never rebuilds a
+        # frame from row dicts.
         return [
-            {"name": tname, "rows": (dict(r) for r in df.iter_rows(named=True))}  # type: ignore[attr-defined]
-            for tname, df in self._dfs.items()
+            {
+                "name": tname,
+                "rows": self._iter_sheet_rows(tname),
+                "batches": lambda n_rows, tname=tname: self._iter_sheet_batches(tname, n_rows),
+            }
+            for tname in self._sheets
         ]
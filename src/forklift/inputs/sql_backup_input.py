@@ -33,6 +33,15 @@ class SQLBackupInput(BaseInput):
         """
         return self._delegate.get_tables()
 
+    def get_insert_lines(self, schema: str | None, name: str) -> List[str]:
+        """Return raw INSERT lines for one table from the delegate's parse index.
+
+        :param schema: Schema name.
+        :param name: Table name.
+        :return: INSERT statement lines in file order.
+        """
+        return self._delegate.get_insert_lines(schema, name)
+
     def _get_all_tables(self) -> List[Tuple[str | None, str]]:
         """Return ``(schema, name)`` tuples for all included tables/views.
 
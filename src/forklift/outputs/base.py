@@ -1,8 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
 from ..types import RowResult, Row
 
+if TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+
 class BaseOutput(ABC):
     """Abstract base for output writers.
 
@@ -30,6 +33,21 @@ class BaseOutput(ABC):
         """
         ...
 
+    def write_batch(self, batch: "pl.DataFrame") -> None:
+        """Persist a columnar batch of accepted rows.
+
+        The default implementation falls back to :meth:`write` once per row;
+        columnar writers should override it to avoid the per-row round trip.
+        A boolean ``__forklift_skip__`` column (if present) flags rows dropped
+        by de-duplication; the flag is only forwarded for flagged rows.
+
+        :param batch: Polars DataFrame holding rows of a single logical table.
+        """
+        for row in batch.to_dicts():
+            if "__forklift_skip__" in row and not row["__forklift_skip__"]:
+                del row["__forklift_skip__"]
+            self.write(row)
+
     @abstractmethod
     def quarantine(self, rr: RowResult) -> None:
         """Record a rejected row and its associated error.
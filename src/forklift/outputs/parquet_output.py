@@ -30,6 +30,39 @@ import pyarrow.parquet as pq
 import polars as pl
 
 
+def _frame_to_arrow(df: pl.DataFrame, decimal_precisions: Dict[str, int] | None = None) -> pa.Table:
+    """Convert a Polars frame to Arrow using the types of the row path.
+
+    Polars emits ``large_string`` / ``large_binary`` buffers; downcast them so
+    batch-written files match files built via ``pa.Table.from_pylist``.
+    Polars decimals always carry precision 38; columns listed in
+    ``decimal_precisions`` are narrowed to their declared precision. A column
+    holding a value too wide for its declared precision keeps precision 38.
+    """
+    table_pa = df.to_arrow()
+    decimal_precisions = decimal_precisions or {}
+    columns = []
+    changed = False
+    for name, column in zip(table_pa.column_names, table_pa.columns):
+        target = column.type
+        if pa.types.is_large_string(target):
+            target = pa.string()
+        elif pa.types.is_large_binary(target):
+            target = pa.binary()
+        elif pa.types.is_decimal(target) and name in decimal_precisions:
+            precision = decimal_precisions[name]
+            if 0 < precision < target.precision:
+                target = pa.decimal128(precision, target.scale)
+        if target != column.type:
+            try:
+                column = column.cast(target)
+                changed = True
+            except pa.ArrowInvalid:
+                pass
+        columns.append(column)
+    return pa.Table.from_arrays(columns, names=table_pa.column_names) if changed else table_pa
+
+
 class PQOutput(BaseOutput):
     """Parquet output writer with per-table file emission.
 
@@ -38,12 +71,28 @@ class PQOutput(BaseOutput):
         DataFrame per table and write with ``DataFrame.write_parquet``.
       * ``chunked``: flush row buffers to Parquet incrementally using a
         ``pyarrow.parquet.ParquetWriter`` once ``chunk_size`` is reached.
+        Flushed chunks are held as Arrow tables until a full row group of
+        ``row_group_size`` rows can be written, so small engine chunks do
+        not each become a row group of their own. At most ``chunk_size``
+        rows are held per table; reaching that cap writes a smaller row group.
+
+    Rows arrive either one at a time via :meth:`write` or as columnar
+    batches via :meth:`write_batch` (the engine's preferred path).
 
     :param dest: Output directory path (created if missing).
     :param schema: Optional schema dict containing ``fields`` collection (for validation only).
     :param mode: ``vectorized`` or ``chunked``.
     :param chunk_size: Row count threshold for flushing in ``chunked`` mode.
-    :param compression: Parquet compression codec (default ``snappy``).
+    :param compression: Parquet compression codec (default ``zstd``).
+    :param compression_level: Codec level for ``zstd``/``gzip``/``brotli``
+        (default ``3`` for ``zstd``, codec default otherwise).
+    :param use_dictionary: Dictionary-encode all columns (``True``, default) or
+        only the listed ones. ``_table`` and schema ``enum`` columns are always
+        dictionary-encoded.
+    :param row_group_size: Maximum rows per row group (default ``1_000_000``).
+    :param data_page_size: Target data page size in bytes (default 1 MiB).
+    :param write_batch_size: Values encoded per page-write batch (``None``
+        keeps the pyarrow default).
     """
 
     def __init__(
@@ -53,7 +102,12 @@ class PQOutput(BaseOutput):
         *,
         mode: str = "vectorized",
         chunk_size: int = 50_000,
-        compression: str = "snappy",
+        compression: str = "zstd",
+        compression_level: int | None = None,
+        use_dictionary: bool | List[str] = True,
+        row_group_size: int = 1_000_000,
+        data_page_size: int = 1 << 20,
+        write_batch_size: int | None = None,
         **kwargs: Any,
     ):
         super().__init__(dest, schema, **kwargs)
@@ -62,14 +116,34 @@ class PQOutput(BaseOutput):
         if compression not in allowed_comp:
             raise ValueError(f"Unsupported compression '{compression}'. Allowed: {sorted(allowed_comp)}")
         self.compression: Literal["snappy", "gzip", "brotli", "zstd", "lz4", "uncompressed"] = compression  # type: ignore[assignment]
+        if compression_level is None and compression == "zstd":
+            compression_level = 3
+        if compression_level is not None and compression not in {"zstd", "gzip", "brotli"}:
+            raise ValueError(f"compression_level is not supported for '{compression}'")
+        self.compression_level = compression_level
+        self.row_group_size = row_group_size
+        self.data_page_size = data_page_size
+        self.write_batch_size = write_batch_size
+        if use_dictionary is True:
+            self.use_dictionary: bool | List[str] = True
+        else:
+            # Low-cardinality columns stay dictionary-encoded even when the caller opts out globally
+            forced = ["_table", *self._enum_columns(schema)]
+            self.use_dictionary = list(dict.fromkeys([*(use_dictionary or []), *forced]))
+        self._decimal_precisions = self._decimal_columns(schema)
         self.mode = mode.lower()
         if self.mode not in {"vectorized", "chunked"}:
             raise ValueError("mode must be 'vectorized' or 'chunked'")
         # vectorized mode always valid now (polars assumed present)
         self.chunk_size = chunk_size
         self.row_buffers: Dict[str, List[Row]] = {}
+        # Arrow tables handed over through ``write_batch`` (vectorized mode only)
+        self.batch_buffers: Dict[str, List[pa.Table]] = {}
         # For chunked mode: maintain ParquetWriter per table
         self._writers: Dict[str, pq.ParquetWriter] = {}
+        # For chunked mode: Arrow chunks (and their row count) awaiting a full row group
+        self._pending_groups: Dict[str, List[pa.Table]] = {}
+        self._pending_rows: Dict[str, int] = {}
 
     def open(self) -> None:  # type: ignore[override]
         self.output_dir = Path(self.dest)
@@ -85,6 +159,8 @@ class PQOutput(BaseOutput):
                 if isinstance(f, dict) and f.get("name") and f.get("type"):
                     self._type_map[str(f["name"])]= f.get("type")
         self._has_validation = bool(self._type_map)
+        # Build the validating coercer once; its type specs are normalized at construction
+        self._validator = self._build_validator() if self._has_validation else None
 
     # ---------------- Public write API -----------
     def write(self, row: Row) -> None:  # type: ignore[override]
@@ -105,6 +181,40 @@ class PQOutput(BaseOutput):
             if self.mode == "chunked" and len(buf) >= self.chunk_size:
                 self._flush_table_chunk(table_name)
 
+    def write_batch(self, batch: pl.DataFrame) -> None:  # type: ignore[override]
+        """Persist a columnar batch of accepted rows for one logical table.
+
+        Rows flagged via ``__forklift_skip__`` count as read but are not kept.
+        The batch is converted to Arrow once and either buffered (vectorized)
+        or appended to the table's ``ParquetWriter`` (chunked).
+
+        :param batch: Polars DataFrame; ``_table`` names the target table.
+        """
+        if batch.height == 0:
+            return
+        self.counters["read"] += batch.height
+        if "__forklift_skip__" in batch.columns:
+            batch = batch.filter(~pl.col("__forklift_skip__").fill_null(False))
+        internal_cols = [c for c in batch.columns if c.startswith("__forklift_")]
+        if internal_cols:
+            batch = batch.drop(internal_cols)
+        if batch.height == 0:
+            return
+        table_name = (batch.get_column("_table")[0] if "_table" in batch.columns else None) or "data"
+        if self._has_validation:
+            batch, errors = self._validate_frame(batch)
+            for orig_row, exc in errors:
+                self.quarantine_handle.write(json.dumps({"row": orig_row, "error": str(exc)}, ensure_ascii=False) + "\n")
+            self.counters["rejected"] += len(errors)
+            if batch.height == 0:
+                return
+        self.counters["kept"] += batch.height
+        table_pa = _frame_to_arrow(batch, self._decimal_precisions)
+        if self.mode == "chunked":
+            self._write_arrow_chunk(table_name, table_pa)
+        else:
+            self.batch_buffers.setdefault(table_name, []).append(table_pa)
+
     def quarantine(self, rr: RowResult) -> None:  # manual path
         self.counters["read"] += 1
         self.counters["rejected"] += 1
@@ -112,24 +222,105 @@ class PQOutput(BaseOutput):
         self.quarantine_handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
 
     # ---------------- Internal helpers ------------
+    @staticmethod
+    def _enum_columns(schema: dict | None) -> List[str]:
+        if not isinstance(schema, dict):
+            return []
+        props = schema.get("properties") or {}
+        return [name for name, spec in props.items() if isinstance(spec, dict) and "enum" in spec]
+
+    @staticmethod
+    def _decimal_columns(schema: dict | None) -> Dict[str, int]:
+        """Map schema ``decimal`` properties to their declared ``precision``."""
+        if not isinstance(schema, dict):
+            return {}
+        props = schema.get("properties") or {}
+        return {
+            name: spec["precision"]
+            for name, spec in props.items()
+            if isinstance(spec, dict) and spec.get("type") == "decimal" and isinstance(spec.get("precision"), int)
+        }
+
+    def _writer_options(self) -> Dict[str, Any]:
+        """Encoding options shared by ``ParquetWriter`` and ``write_table``."""
+        options: Dict[str, Any] = {
+            "compression": self.compression,
+            "compression_level": self.compression_level,
+            "use_dictionary": self.use_dictionary,
+            "data_page_size": self.data_page_size,
+        }
+        if self.write_batch_size is not None:
+            options["write_batch_size"] = self.write_batch_size
+        return options
+
     @staticmethod
     def _sanitize_table_name(name: str) -> str:
         base = Path(name).name
         return base.replace("/", "_").replace("\\", "_")
 
-    def _validate_rows(self, rows: List[Row]) -> tuple[List[Row], List[tuple[Row, Exception]]]:
-        if not self._has_validation or not rows:
-            return rows, []
+    def _build_validator(self) -> Any:
         try:
             from ..preprocessors.type_coercion import TypeCoercion  # lazy import
         except Exception:  # pragma: no cover
-            return rows, []  # fail open
-        df = pl.DataFrame(rows)
-        tc = TypeCoercion(types=self._type_map)
-        coerced = tc.process_dataframe(df)
-        errors = getattr(tc, "_df_errors", [])
+            return None  # fail open
+        return TypeCoercion(types=self._type_map)
+
+    def _validate_rows(self, rows: List[Row]) -> tuple[List[Row], List[tuple[Row, Exception]]]:
+        if not self._has_validation or not rows:
+            return rows, []
+        coerced, errors = self._validate_frame(pl.DataFrame(rows))
         return coerced.to_dicts(), errors
 
+    def _validate_frame(self, df: pl.DataFrame) -> tuple[pl.DataFrame, List[tuple[Row, Exception]]]:
+        tc = self._validator
+        if tc is None:
+            return df, []  # fail open
+        coerced = tc.process_dataframe(df)
+        return coerced, getattr(tc, "_df_errors", [])
+
+    def _write_arrow_chunk(self, table_name: str, table_pa: pa.Table) -> None:
+        """Queue an Arrow chunk; write whole row groups once enough rows are pending.
+
+        Whatever is still queued is written as a smaller row group once it
+        reaches ``chunk_size`` rows, so chunked mode never holds more than
+        that per table.
+        """
+        pending = self._pending_groups.setdefault(table_name, [])
+        pending.append(table_pa)
+        pending_rows = self._pending_rows.get(table_name, 0) + table_pa.num_rows
+        self._pending_rows[table_name] = pending_rows
+        if pending_rows >= self.row_group_size:
+            self._write_pending_groups(table_name, final=False)
+        if self._pending_rows.get(table_name, 0) >= self.chunk_size:
+            self._write_pending_groups(table_name, final=True)
+
+    def _write_pending_groups(self, table_name: str, final: bool) -> None:
+        """Write queued chunks as full row groups, keeping any remainder queued unless ``final``."""
+        pending = self._pending_groups.pop(table_name, None)
+        total = self._pending_rows.pop(table_name, 0)
+        if not pending or not total:
+            return
+        table_pa = pending[0] if len(pending) == 1 else pa.concat_tables(pending, promote_options="permissive")
+        if not final:
+            full = total - total % self.row_group_size
+            if full < total:
+                self._pending_groups[table_name] = [table_pa.slice(full)]
+                self._pending_rows[table_name] = total - full
+                table_pa = table_pa.slice(0, full)
+        writer = self._writers.get(table_name)
+        if writer is None:
+            out_path = self.output_dir / f"{self._sanitize_table_name(table_name)}.parquet"
+            writer = pq.ParquetWriter(out_path, table_pa.schema, **self._writer_options())
+            self._writers[table_name] = writer
+        elif table_pa.schema != writer.schema:
+            try:
+                table_pa = table_pa.cast(writer.schema)
+            except (pa.ArrowException, ValueError, TypeError) as e:
+                raise ValueError(
+                    f"Rows for table '{table_name}' do not match the schema already written to its Parquet file: {e}"
+                ) from e
+        writer.write_table(table_pa, row_group_size=self.row_group_size)
+
     def _flush_table_chunk(self, table_name: str) -> None:
         rows = self.row_buffers.get(table_name)
         if not rows:
@@ -143,29 +334,17 @@ class PQOutput(BaseOutput):
             self.counters["kept"] += len(kept_rows)
             self.counters["rejected"] += len(errors)
             if kept_rows:
-                table_pa = pa.Table.from_pylist(kept_rows)  # type: ignore[arg-type]
-                safe_name = self._sanitize_table_name(table_name)
-                out_path = self.output_dir / f"{safe_name}.parquet"
-                writer = self._writers.get(table_name)
-                if writer is None:
-                    writer = pq.ParquetWriter(out_path, table_pa.schema, compression=self.compression)
-                    self._writers[table_name] = writer
-                writer.write_table(table_pa)
+                self._write_arrow_chunk(table_name, pa.Table.from_pylist(kept_rows))  # type: ignore[arg-type]
         else:
             # No validation path (original behavior)
-            table_pa = pa.Table.from_pylist(rows)  # type: ignore[arg-type]
-            safe_name = self._sanitize_table_name(table_name)
-            out_path = self.output_dir / f"{safe_name}.parquet"
-            writer = self._writers.get(table_name)
-            if writer is None:
-                writer = pq.ParquetWriter(out_path, table_pa.schema, compression=self.compression)
-                self._writers[table_name] = writer
-            writer.write_table(table_pa)
+            self._write_arrow_chunk(table_name, pa.Table.from_pylist(rows))  # type: ignore[arg-type]
         rows.clear()
 
     def _flush_all_chunked(self) -> None:
         for table_name in list(self.row_buffers.keys()):
             self._flush_table_chunk(table_name)
+        for table_name in list(self._pending_groups.keys()):
+            self._write_pending_groups(table_name, final=True)
         for writer in self._writers.values():
             try:
                 writer.close()
@@ -174,35 +353,33 @@ class PQOutput(BaseOutput):
         self._writers.clear()
 
     def _flush_vectorized(self) -> None:
-        if not self.row_buffers:
+        if not self.row_buffers and not self.batch_buffers:
             return
-        if self._has_validation:
-            # per-table validation & write
-            for table_name, rows in self.row_buffers.items():
-                if not rows:
-                    continue
+        pending: Dict[str, List[pa.Table]] = {}
+        for table_name, rows in self.row_buffers.items():
+            if not rows:
+                continue
+            if self._has_validation:
                 kept_rows, errors = self._validate_rows(rows)
                 for orig_row, exc in errors:
                     self.quarantine_handle.write(json.dumps({"row": orig_row, "error": str(exc)}, ensure_ascii=False) + "\n")
-                if kept_rows:
-                    safe_table_name = self._sanitize_table_name(table_name)
-                    out_path = self.output_dir / f"{safe_table_name}.parquet"
-                    table_pa = pa.Table.from_pylist(kept_rows)  # type: ignore[arg-type]
-                    pq.write_table(table_pa, out_path, compression=self.compression)
                 self.counters["kept"] += len(kept_rows)
                 self.counters["rejected"] += len(errors)
-                rows.clear()
+            else:
+                kept_rows = rows
+            if kept_rows:
+                pending.setdefault(table_name, []).append(pa.Table.from_pylist(kept_rows))  # type: ignore[arg-type]
+            rows.clear()
+        if self._has_validation:
             self._validated = True
-            return
-        # No validation path
-        for table_name, rows in self.row_buffers.items():
-            if not rows:
-                continue
+        for table_name, tables in self.batch_buffers.items():
+            pending.setdefault(table_name, []).extend(tables)
+        self.batch_buffers.clear()
+        for table_name, tables in pending.items():
             safe_table_name = self._sanitize_table_name(table_name)
             out_path = self.output_dir / f"{safe_table_name}.parquet"
-            table_pa = pa.Table.from_pylist(rows)  # type: ignore[arg-type]
-            pq.write_table(table_pa, out_path, compression=self.compression)
-            rows.clear()
+            table_pa = tables[0] if len(tables) == 1 else pa.concat_tables(tables, promote_options="permissive")
+            pq.write_table(table_pa, out_path, row_group_size=self.row_group_size, **self._writer_options())
 
     def _flush_parquet(self) -> None:
         if self.mode == "chunked":
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 class Preprocessor(ABC):
     """Abstract row preprocessor interface.
 
     Implementations receive and return a row dict, possibly mutating values or
-    raising errors which upstream code can capture.
+    raising errors which upstream code can capture. Implementations that reject
+    rows routinely can override :meth:`try_apply` to report failures without
+    raising.
     """
     @abstractmethod
     def apply(self, row: Dict[str, Any]) -> Dict[str, Any]:
@@ -16,3 +18,18 @@ class Preprocessor(ABC):
         :return: Transformed row dictionary.
         :raises Exception: Implementations may raise to signal row rejection.
         """
+
+    def try_apply(self, row: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Apply the preprocessor, returning the outcome instead of raising.
+
+        The default delegates to :meth:`apply`; override it when rejection is
+        an expected outcome so the engine avoids exception unwinding per bad row.
+
+        :param row: Input row dictionary.
+        :return: ``(True, transformed_row)`` on success, ``(False, error)`` where
+            ``error`` is the :class:`Exception` describing the rejection.
+        """
+        try:
+            return True, self.apply(row)
+        except Exception as exc:
+            return False, exc
@@ -311,10 +311,13 @@ class TypeCoercion(Preprocessor):
             self._df_errors = []  # type: ignore[attr-defined]
             return df
 
-        # Capture original rows and append a stable row index column for later error reconstruction
-        original_rows = df.to_dicts()
+        # Keep the untouched frame for error reconstruction; only failing rows are
+        # materialized as dicts later. Append a stable row index column to locate them.
+        original_df = df
         # Use modern Polars API (with_row_index) – drop deprecated with_row_count to avoid warnings
         df = df.with_row_index('__row_idx__')  # type: ignore[attr-defined]
+        # Columns already typed as strings get native string checks instead of per-value Python callbacks
+        utf8_fields = {name for name, dtype in original_df.schema.items() if dtype == pl.Utf8}
 
         cast_exprs: list[pl.Expr] = []
         invalid_exprs: list[tuple[str, pl.Expr]] = []  # (field_name, invalid_mask_expr)
@@ -326,6 +329,11 @@ class TypeCoercion(Preprocessor):
             col = pl.col(field)
             null_tokens = self.nulls.get(field)
             # Treat blank only if original value is a string consisting solely of whitespace
+            if field in utf8_fields:
+                cond = col.is_null() | (col.str.strip_chars() == "")
+                if null_tokens:
+                    cond = cond | col.is_in(list(null_tokens))
+                return pl.when(cond).then(pl.lit(None)).otherwise(col)
             is_blank = col.map_elements(lambda v: isinstance(v, str) and v.strip() == "", return_dtype=pl.Boolean)
             cond = col.is_null() | is_blank
             if null_tokens:
@@ -333,6 +341,11 @@ class TypeCoercion(Preprocessor):
                 cond = cond | col.map_elements(lambda v: isinstance(v, str) and v in tok_set_local, return_dtype=pl.Boolean)
             return pl.when(cond).then(pl.lit(None)).otherwise(col)
 
+        def _is_str(field: str) -> pl.Expr:
+            if field in utf8_fields:
+                return pl.col(field).is_not_null()
+            return pl.col(field).map_elements(lambda v: isinstance(v, str), return_dtype=pl.Boolean)
+
         def _norm_numeric_tokens(e: pl.Expr) -> pl.Expr:
             # Strip currency and commas; convert parentheses to leading minus
             e = e.cast(pl.Utf8, strict=False).str.strip_chars()
@@ -383,7 +396,7 @@ class TypeCoercion(Preprocessor):
                     "%b %d, %Y",
                 ]
 
-                is_str = pl.col(field).map_elements(lambda v: isinstance(v, str), return_dtype=pl.Boolean)
+                is_str = _is_str(field)
 
                 parsed_try = pl.coalesce([
                     *[src.cast(pl.Utf8).str.strptime(pl.Date, format=f, strict=False) for f in candidates]
@@ -419,8 +432,11 @@ class TypeCoercion(Preprocessor):
                     "%Y/%m/%d %H:%M:%S",
                 ]
 
-                is_str = pl.col(field).map_elements(lambda v: isinstance(v, str), return_dtype=pl.Boolean)
-                is_py_dt = pl.col(field).map_elements(lambda v: isinstance(v, datetime), return_dtype=pl.Boolean)
+                is_str = _is_str(field)
+                is_py_dt = (
+                    pl.lit(False) if field in utf8_fields
+                    else pl.col(field).map_elements(lambda v: isinstance(v, datetime), return_dtype=pl.Boolean)
+                )
                 str_parsed = pl.coalesce([
                     *[
                         src.cast(pl.Utf8)
@@ -575,13 +591,12 @@ class TypeCoercion(Preprocessor):
             if per_field_flags:
                 bad_err_df = bad.select([expr.alias(f"__bad__{name}") for name, expr in per_field_flags])
                 flags = bad_err_df.to_numpy()
-                bad_orig = bad.select(df.columns).to_dicts()
-                # Replace bad_orig with original raw rows using stored row index
+                # Report the original raw rows, located through the stored row index
                 if "__row_idx__" in bad.columns:
-                    idx_series = bad.select(["__row_idx__"]).to_series().to_list()
-                    bad_raw_rows = [original_rows[i] for i in idx_series]
+                    idx_series = bad.get_column("__row_idx__")
+                    bad_raw_rows = original_df.select(pl.all().gather(idx_series)).to_dicts()
                 else:
-                    bad_raw_rows = bad_orig
+                    bad_raw_rows = bad.select(df.columns).to_dicts()
                 for raw_row, flag_row in zip(bad_raw_rows, flags):
                     failing = [name for (name, _), flag in zip(per_field_flags, flag_row) if bool(flag)]
                     if failing:
@@ -5,7 +5,10 @@ from typing import Any, Dict, Optional
 Row = Dict[str, Any]
 
 
-@dataclass
+@dataclass(frozen=True)
 class RowResult:
+    # Declared by hand: ``dataclass(slots=True)`` needs Python 3.10+.
+    __slots__ = ("row", "error")
+
     row: Optional[Row]
     error: Optional[Exception]
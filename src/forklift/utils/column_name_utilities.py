@@ -1,6 +1,10 @@
 import re
+from functools import lru_cache
 from typing import List
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_UNDERSCORES_RE = re.compile(r"_+")
+
 def dedupe_column_names(names: List[str]) -> List[str]:
     """
     Ensure all names in the given list are unique by appending numeric suffixes
@@ -13,36 +17,29 @@ def dedupe_column_names(names: List[str]) -> List[str]:
     :param names: List of original names (possibly with duplicates).
     :returns: List of deduplicated names with suffixes applied where needed.
     """
-    seen_counts: dict[str, int] = {}
+    # Next suffix to try per base name; suffixes below it are known to be taken,
+    # so each lookup resumes where the previous duplicate of that base stopped.
+    next_suffix: dict[str, int] = {}
     deduped: list[str] = []
     used_names: set[str] = set()
 
     for name in names:
-        base_name = name
-        count = seen_counts.get(base_name, 0)
-
-        if count == 0 and base_name not in used_names:
-            deduped.append(base_name)
-            seen_counts[base_name] = 1
-            used_names.add(base_name)
+        if name not in used_names:
+            new_name = name
         else:
-            new_name = f"{base_name}_1"  # Start at _1 for first duplicate
+            suffix = next_suffix.get(name, 1)  # Start at _1 for first duplicate
+            new_name = f"{name}_{suffix}"
             while new_name in used_names:
-                # Find the last numeric suffix and increment it
-                match = re.match(r"(.+?)(_\d+)+$", new_name)
-                if match:
-                    prefix = match.group(1)
-                    suffixes = re.findall(r"_\d+", new_name)
-                    last_num = int(suffixes[-1][1:]) + 1
-                    new_name = f"{prefix}{''.join(suffixes[:-1])}_{last_num}"
-
-            deduped.append(new_name)
-            seen_counts[base_name] = count + 1
-            used_names.add(new_name)
+                suffix += 1
+                new_name = f"{name}_{suffix}"
+            next_suffix[name] = suffix + 1
+        deduped.append(new_name)
+        used_names.add(new_name)
 
     return deduped
 
 
+@lru_cache(maxsize=4096)
 def standardize_postgres_column_name(name: str) -> str:
     """
     Standardize a column name for Postgres compatibility:
@@ -52,10 +49,13 @@ def standardize_postgres_column_name(name: str) -> str:
     - Strip leading/trailing underscores
     - Truncate to 63 characters (Postgres limit)
 
+    Results are memoized, so headers seen before (e.g. the same CSV layout
+    ingested repeatedly) cost a single cache lookup.
+
     :param name: The column name to standardize.
     :returns: Standardized column name string.
     """
     s = name.strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _NON_ALNUM_RE.sub("_", s)
+    s = _UNDERSCORES_RE.sub("_", s).strip("_")
     return s[:63]
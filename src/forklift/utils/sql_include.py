@@ -53,13 +53,6 @@ def derive_sql_include_patterns(schema: Dict[str, Any] | None) -> List[str]:
             include_patterns.append(table_name)
 
     if not include_patterns:
-        include_patterns = ["*.*"]
-
-    seen = set()
-    deduped: List[str] = []
-    for p in include_patterns:
-        if p not in seen:
-            seen.add(p)
-            deduped.append(p)
-    return deduped
-
+        return ["*.*"]
+    # dict preserves first-seen order while dropping duplicates
+    return list(dict.fromkeys(include_patterns))
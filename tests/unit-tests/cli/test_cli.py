@@ -13,7 +13,7 @@ class DummyEngine:
 
 @pytest.fixture(autouse=True)
 def patch_engine(monkeypatch):
-    monkeypatch.setattr('forklift.cli.Engine', DummyEngine)
+    monkeypatch.setattr('forklift.engine.engine.Engine', DummyEngine)
 
 @pytest.mark.parametrize('args', [
     ['ingest', 'source.csv', '--dest', 'out.parquet', '--input-kind', 'csv'],
@@ -70,3 +70,8 @@ def test_cli_invalid_fwf_spec_json(monkeypatch):
         with pytest.raises(json.JSONDecodeError):
             main()
     os.unlink(tf.name)
+
+def test_cli_import_defers_engine():
+    import subprocess
+    code = "import sys, forklift.cli; sys.exit('polars' in sys.modules or 'forklift.engine.engine' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code], env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))).returncode == 0
@@ -63,3 +63,182 @@ def test_run_success(engine):
     engine.Input = lambda source, header_override=None, **opts: DummyInput(source, rows=rows)
     engine.run('source', 'dest')
     assert len(out.written) == 2
+
+def test_run_hands_accepted_rows_to_write_batch(engine):
+    rows = [{'id': 1}, {'id': 1}, {'id': None}, {'id': 2}]
+    batches = []
+
+    class BatchOutput(DummyOutput):
+        def write_batch(self, batch):
+            batches.append(batch)
+
+    out = BatchOutput('dest')
+    engine.Output = lambda dest, schema=None, **opts: out
+    engine.Input = lambda source, header_override=None, **opts: DummyInput(source, rows=rows)
+    engine.run('source', 'dest')
+    assert out.written == []
+    assert len(out.quarantined) == 1
+    assert len(batches) == 1
+    batch = batches[0]
+    assert batch.get_column('id').to_list() == [1, 1, 2]
+    assert batch.get_column('__forklift_skip__').to_list() == [False, True, False]
+    assert set(batch.get_column('_table').to_list()) == {'dummy'}
+
+def test_required_mask_matches_row_check(engine):
+    import polars as pl
+
+    def mask(df):
+        return df.with_columns(engine._required_mask(df).alias('ok')).get_column('ok').to_list()
+
+    df = pl.DataFrame({'id': ['1', '  ', None, 'x'], 'other': [1, 2, 3, 4]})
+    assert mask(df) == [engine._required_ok(r) for r in df.to_dicts()] == [True, False, False, True]
+    # required column absent from the header -> tolerated
+    assert mask(pl.DataFrame({'other': [1, 2]})) == [True, True]
+    engine.allow_required_nulls = True
+    assert mask(df) == [True] * 4
+
+def test_deduplication_spans_chunks(engine):
+    rows = [{'id': 1}, {'id': 2}, {'id': 2}, {'id': 1}, {'id': 3}]
+    out = DummyOutput('dest')
+    engine.processing_chunk_size = 2
+    engine.Output = lambda dest, schema=None, **opts: out
+    engine.Input = lambda source, header_override=None, **opts: DummyInput(source, rows=rows)
+    engine.run('source', 'dest')
+    assert [r['id'] for r in out.written if not r.get('__forklift_skip__')] == [1, 2, 3]
+    assert [r['id'] for r in out.written if r.get('__forklift_skip__')] == [2, 1]
+
+def test_column_batches_preferred_over_rows(engine):
+    out = DummyOutput('dest')
+
+    class BatchInput(DummyInput):
+        def get_tables(self):
+            def batches(size):
+                assert size == 2
+                yield {'id': [1, None]}
+                yield {'id': [1]}
+            return [{"name": "dummy", "rows": iter([{'id': 99}]), "batches": batches}]
+
+    engine.processing_chunk_size = 2
+    engine.Output = lambda dest, schema=None, **opts: out
+    engine.Input = lambda source, header_override=None, **opts: BatchInput(source)
+    engine.run('source', 'dest')
+    assert [(r['id'], r.get('__forklift_skip__', False)) for r in out.written] == [(1, False), (1, True)]
+    assert len(out.quarantined) == 1
+
+def test_dataframe_batches_used_as_is(engine):
+    import polars as pl
+    out = DummyOutput('dest')
+    frame = pl.DataFrame({'id': [1, 2, 2, 3]})
+
+    class FrameInput(DummyInput):
+        def get_tables(self):
+            return [{"name": "sheet", "rows": frame.iter_rows(named=True), "batches": frame.iter_slices}]
+
+    engine.processing_chunk_size = 3
+    engine.Output = lambda dest, schema=None, **opts: out
+    engine.Input = lambda source, header_override=None, **opts: FrameInput(source)
+    engine.run('source', 'dest')
+    assert [r['id'] for r in out.written if not r.get('__forklift_skip__')] == [1, 2, 3]
+    assert {r['_table'] for r in out.written} == {'sheet'}
+
+def test_leading_row_preprocessors_take_uniform_rows_directly(engine):
+    rows = [{'id': 1}, {'id': 2}]
+    assert engine._leads_with_rows(rows)
+    assert not engine._leads_with_rows([{'id': 1}, {'id': 2, 'extra': 3}])
+    df = engine._apply_preprocessors_dataframe(rows)
+    assert df.to_dicts() == [{'id': 1, 'processed': True}, {'id': 2, 'processed': True}]
+    # the chain works on copies; the input's dicts are left alone
+    assert rows == [{'id': 1}, {'id': 2}]
+
+def test_provided_header_resolved_once(monkeypatch):
+    monkeypatch.setattr('forklift.engine.engine.get_input_cls', lambda kind: DummyInput)
+    monkeypatch.setattr('forklift.engine.engine.get_output_cls', lambda kind: DummyOutput)
+    monkeypatch.setattr('forklift.engine.engine.get_preprocessors', lambda pre, schema=None: [])
+    schema = {'x-csv': {'header': {'mode': 'provided', 'columns': ['a', 'b']}}}
+    engine = Engine('csv', 'parquet', schema=schema)
+    seen = {}
+
+    def make_input(source, header_override=None, **opts):
+        seen['header_override'] = header_override
+        return DummyInput(source, rows=[{'a': 1, 'b': 2}])
+
+    engine.Input = make_input
+    engine.run('source', 'dest')
+    assert seen['header_override'] == ['a', 'b']
+    with pytest.raises(AttributeError):
+        engine.unexpected_attribute = True
+
+def test_table_column_added_without_touching_source_rows(engine):
+    rows = [{'id': 1}, {'id': 2}]
+    out = DummyOutput('dest')
+    engine.Output = lambda dest, schema=None, **opts: out
+    engine.Input = lambda source, header_override=None, **opts: DummyInput(source, rows=rows)
+    engine.run('source', 'dest')
+    assert rows == [{'id': 1}, {'id': 2}]
+    assert [r['_table'] for r in out.written] == ['dummy', 'dummy']
+
+def test_try_apply_rejections_quarantined_without_raising(monkeypatch):
+    from forklift.preprocessors.base import Preprocessor
+
+    class Rejecting(Preprocessor):
+        def apply(self, row):
+            raise AssertionError('try_apply should be used instead')
+
+        def try_apply(self, row):
+            if row['id'] % 2:
+                return False, ValueError(f"odd id {row['id']}")
+            return True, dict(row, even=True)
+
+    class Raising(Preprocessor):
+        def apply(self, row):
+            if row['id'] == 2:
+                raise ValueError('two')
+            return row
+
+    monkeypatch.setattr('forklift.engine.engine.get_input_cls', lambda kind: DummyInput)
+    monkeypatch.setattr('forklift.engine.engine.get_output_cls', lambda kind: DummyOutput)
+    monkeypatch.setattr('forklift.engine.engine.get_preprocessors', lambda pre, schema=None: [Rejecting(), Raising()])
+    engine = Engine('csv', 'parquet')
+    rows = [{'id': 1}, {'id': 2}, {'id': 4}]
+    out = DummyOutput('dest')
+    engine.Output = lambda dest, schema=None, **opts: out
+    engine.Input = lambda source, header_override=None, **opts: DummyInput(source, rows=rows)
+    engine.run('source', 'dest')
+    assert [r['id'] for r in out.written] == [4]
+    assert sorted(str(rr.error) for rr in out.quarantined) == ['odd id 1', 'two']
+    assert Raising().try_apply({'id': 2})[0] is False
+
+def test_compiled_row_chain_stops_at_first_rejection():
+    from forklift.engine.engine import _compile_row_chain
+    calls = []
+
+    def add_one(row):
+        calls.append('add')
+        return dict(row, n=row['n'] + 1)
+
+    def reject_big(row):
+        return (False, ValueError('big')) if row['n'] > 1 else (True, row)
+
+    chain = _compile_row_chain([('apply', add_one), ('try', reject_big), ('apply', add_one)])
+    assert chain({'n': 0}) == (True, {'n': 2}, None)
+    ok, row, exc = chain({'n': 5})
+    assert (ok, row, str(exc)) == (False, {'n': 6}, 'big')
+    assert calls == ['add', 'add', 'add']
+
+
+def test_sql_backup_batches_infer_mixed_numeric_columns(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    dump = tmp_path / "d.sql"
+    dump.write_text(
+        "INSERT INTO s.p (id, price) VALUES (1, 20);\n"
+        "INSERT INTO s.p (id, price) VALUES (2, 19.99);\n"
+        "INSERT INTO s.p (id, price) VALUES (3, 5);\n"
+    )
+    out = tmp_path / "out"
+    Engine('sql_backup', 'parquet').run(str(dump), str(out))
+    table = pq.read_table(out / "p.parquet")
+    # ints and floats in one column widen to Float64, as row-dict inference did
+    assert table.schema.field('price').type == pa.float64()
+    assert table.column('price').to_pylist() == [20.0, 19.99, 5.0]
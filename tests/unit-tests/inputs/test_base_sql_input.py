@@ -111,6 +111,31 @@ def test_get_all_tables_normal(monkeypatch):
     assert tables == {("s1", "t1"), ("s1", "v1"), ("s2", "t2")}
 
 
+def test_get_all_tables_parallel_discovery_keeps_schema_order(monkeypatch):
+    import threading
+    import time
+
+    engine = EngineStub()
+    monkeypatch.setattr("forklift.inputs.base_sql_input.create_engine", lambda source: engine)
+    mapping = {f"s{i}": {"tables": [f"t{i}"], "views": [f"v{i}"]} for i in range(6)}
+    inspector = NormalInspectorStub(mapping=mapping)
+    threads = set()
+    original = inspector.get_table_names
+
+    def slow_get_table_names(schema=None):
+        threads.add(threading.get_ident())
+        time.sleep(0.05 if schema == "s0" else 0)  # first schema finishes last
+        return original(schema)
+
+    inspector.get_table_names = slow_get_table_names
+    monkeypatch.setattr("forklift.inputs.base_sql_input.inspect", lambda eng: inspector)
+
+    inp = BaseSQLInput("dummy://", discovery_workers=4)
+    expected = [item for i in range(6) for item in ((f"s{i}", f"t{i}"), (f"s{i}", f"v{i}"))]
+    assert inp._get_all_tables() == expected
+    assert len(threads) > 1
+
+
 def test_get_tables_pattern_matching(monkeypatch):
     # Provide deterministic inspector content
     engine = EngineStub()
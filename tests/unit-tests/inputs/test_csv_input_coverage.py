@@ -86,6 +86,15 @@ def test_skip_prologue_lines_scan_limit_no_header():
     _skip_prologue_lines(fh, header_row=None, max_scan_rows=2)
     # No assertion needed; just ensure no exception is raised
 
+def test_skip_prologue_lines_header_match_skips_other_widths():
+    """
+    Test _skip_prologue_lines positions the handle at the header row, passing over lines
+    with a different number of cells and lines with the same width but other tokens.
+    """
+    fh = io.StringIO("report,2024\na,b,c,d\nx, y ,z\n a , b , c \n1,2,3\n")
+    _skip_prologue_lines(fh, header_row=["a", "b", "c"], max_scan_rows=None)
+    assert fh.readline() == " a , b , c \n"
+
 def test_get_csv_reader_skipinitialspace():
     fh = io.StringIO("a, b\nc, d\n")
     reader = list(get_csv_reader(fh, ","))
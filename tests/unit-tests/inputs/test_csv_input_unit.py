@@ -203,6 +203,14 @@ def test_dedupe_column_names_suffix_collision():
     assert result == ["x", "x_1", "x_1_1", "x_2"]
 
 
+def test_dedupe_column_names_blank_and_many_duplicates():
+    """
+    Tests that blank names dedupe like any other name and that long runs of duplicates stay linear.
+    """
+    assert dedupe_column_names(["", "", "_1", ""]) == ["", "_1", "_1_1", "_2"]
+    assert dedupe_column_names(["c"] * 1000)[-1] == "c_999"
+
+
 def test_skip_prologue_lines_skips_comments_and_blanks():
     """
     Tests that _skip_prologue_lines skips prologue comments and blank lines, positioning the file handle at the header row.
@@ -307,3 +315,50 @@ def test_csvinput_get_raw_header_headerless_no_override():
     inp = CSVInput("dummy.csv")
     with pytest.raises(ValueError):
         inp._get_raw_header(reader, False, None)
+
+
+def test_csvinput_arrow_engine_matches_row_path(tmp_path: Path):
+    """
+    Tests that engine="arrow" applies the prologue, footer, blank and consecutive duplicate filters like the
+    csv-module path, including duplicates that straddle a batch boundary and quoted newlines.
+    """
+    p = tmp_path / "a.csv"
+    text = "# exported\n\nId,Name\n1,a\n1,a\n\n,\n2,\"b\nc\"\n2,\"b\nc\"\n3,d\nTOTAL,9,9\nSUMMARY\n"
+    write(p, text)
+    expected = list(CSVInput(str(p)).iter_rows())
+    assert expected == [{"id": "1", "name": "a"}, {"id": "2", "name": "b\nc"}, {"id": "3", "name": "d"}]
+    arrow_input = CSVInput(str(p), engine="arrow", arrow_block_size=16)
+    assert list(arrow_input.iter_rows()) == expected
+    (table,) = arrow_input.get_tables()
+    batches = list(table["batches"](1))
+    assert [batch.to_dicts() for batch in batches] == [[row] for row in expected]
+
+
+def test_csvinput_arrow_engine_non_utf8_and_empty(tmp_path: Path):
+    """
+    Tests the arrow path decodes non-UTF-8 sources and yields nothing for a header-only file.
+    """
+    p = tmp_path / "l.csv"
+    p.write_bytes("name\nété\n".encode("cp1252"))
+    assert list(CSVInput(str(p), encoding_priority=["cp1252"], engine="arrow").iter_rows()) == [{"name": "été"}]
+    empty = tmp_path / "e.csv"
+    write(empty, "a,b\n\n")
+    assert list(CSVInput(str(empty), engine="arrow").iter_rows()) == []
+    assert "batches" not in CSVInput(str(empty)).get_tables()[0]
+
+
+def test_csvinput_skip_prologue_disabled(tmp_path: Path, monkeypatch):
+    """
+    Tests that skip_prologue=False reads from the first line without running the prologue scan.
+    """
+    import forklift.inputs.csv_input as csv_input_module
+
+    p = tmp_path / "n.csv"
+    write(p, "1,a\n2,b\n")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("prologue scan should be skipped")
+
+    monkeypatch.setattr(csv_input_module, "_skip_prologue_lines", fail)
+    inp = CSVInput(str(p), header_mode="absent", header_override=["id", "name"], skip_prologue=False)
+    assert list(inp.iter_rows()) == [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]
@@ -0,0 +1,36 @@
+import os
+import pytest
+from forklift.inputs.excel_input import ExcelInput
+
+
+def _excel_path():
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "test-files", "excel", "excel-data.xlsx"))
+
+
+def test_excel_sheets_load_on_first_access():
+    inp = ExcelInput(_excel_path(), tables=[{"name": "Sheet1"}, {"name": "Sheet2"}])
+    assert inp._dfs == {}
+    rows = list(inp.iter_rows("Sheet1"))
+    assert rows and all(isinstance(r, dict) for r in rows)
+    assert list(inp._dfs) == ["Sheet1"]
+    # cached: a second pass does not re-read the sheet
+    df = inp._dfs["Sheet1"]
+    assert list(inp.iter_rows("Sheet1")) == rows
+    assert inp._dfs["Sheet1"] is df
+    assert list(inp.iter_rows("missing")) == []
+
+
+def test_excel_get_tables_defers_reads_until_consumed():
+    inp = ExcelInput(_excel_path(), tables=[{"name": "Sheet1"}, {"name": "Sheet2"}])
+    tables = inp.get_tables()
+    assert [t["name"] for t in tables] == ["Sheet1", "Sheet2"]
+    assert inp._dfs == {}
+    batches = list(tables[1]["batches"](2))
+    assert list(inp._dfs) == ["Sheet2"]
+    assert sum(b.height for b in batches) == inp._dfs["Sheet2"].height
+    assert len(list(tables[0]["rows"])) == inp._dfs["Sheet1"].height
+
+
+def test_excel_table_definition_requires_name():
+    with pytest.raises(ValueError):
+        ExcelInput(_excel_path(), tables=[{"header_override": ["a"]}])
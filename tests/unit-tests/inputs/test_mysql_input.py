@@ -50,3 +50,25 @@ def test_mysql_iter_rows_not_implemented_module_import():
     with pytest.raises(NotImplementedError):
         list(mi.iter_rows())
 
+
+
+def test_mysql_get_all_tables_uses_single_catalog_query(monkeypatch):
+    mi = MySQLInput("sqlite:///:memory:")
+    monkeypatch.setattr(mi.engine.dialect, "name", "mysql")
+    calls = []
+
+    def fake_query(statement, params=None):
+        calls.append(str(statement))
+        return [("appdb", "users"), ("appdb", "v_users")]
+
+    monkeypatch.setattr(mi, "_query_catalog", fake_query)
+    mi.inspector = None  # the inspector must not be consulted
+    assert mi._get_all_tables() == [("appdb", "users"), ("appdb", "v_users")]
+    assert len(calls) == 1 and "information_schema.tables" in calls[0]
+
+
+def test_mysql_get_all_tables_falls_back_to_inspector(monkeypatch):
+    mi = MySQLInput("sqlite:///:memory:")
+    monkeypatch.setattr(mi.engine.dialect, "name", "mysql")
+    mi.inspector = FakeMySQLInspector()  # information_schema does not exist on SQLite
+    assert set(mi._get_all_tables()) == {("appdb", "users"), ("appdb", "v_users"), ("reporting", "facts")}
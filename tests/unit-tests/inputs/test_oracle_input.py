@@ -102,3 +102,20 @@ def test_mysql_iter_rows_not_implemented():
     with pytest.raises(NotImplementedError):
         list(mi.iter_rows())
 
+
+
+def test_oracle_get_all_tables_uses_single_catalog_query(monkeypatch):
+    oi = OracleInput("sqlite:///:memory:")
+    monkeypatch.setattr(oi.engine.dialect, "name", "oracle")
+    monkeypatch.setattr(oi.engine.dialect, "normalize_name", str.lower, raising=False)
+    monkeypatch.setattr(oi, "_query_catalog", lambda statement, params=None: [
+        ("HR", "EMPLOYEES"), ("SYS", "DUAL"), ("HR", "V_EMP"),
+    ])
+    oi.inspector = None
+    assert oi._get_all_tables() == [("hr", "employees"), ("hr", "v_emp")]
+
+
+def test_base_query_catalog_runs_on_shared_connection():
+    from sqlalchemy import text
+    oi = OracleInput("sqlite:///:memory:")
+    assert oi._query_catalog(text("SELECT 'a', 'b' UNION ALL SELECT :s, 'c'"), {"s": "x"}) == [("a", "b"), ("x", "c")]
@@ -18,7 +18,7 @@ def test_registry_lookup():
 def test_sql_backup_parse_tables_and_rows():
     path = _backup_path()
     inp = SQLBackupInput(path)
-    tables = { (t["schema"], t["name"]): t for t in inp.get_tables() }
+    tables = { (t["schema"], t["name"]): list(t["rows"]) for t in inp.get_tables() }
     # Expected tables from dump
     expected = {
         ("alt", "good_customers"): 2,
@@ -28,10 +28,10 @@ def test_sql_backup_parse_tables_and_rows():
     }
     for key, count in expected.items():
         assert key in tables, f"Missing table {key}"
-        assert len(tables[key]["rows"]) == count
+        assert len(tables[key]) == count
 
     # Spot check one row with escaped quote
-    sales_gc = tables[("sales", "good_customers")]["rows"]
+    sales_gc = tables[("sales", "good_customers")]
     ola = next(r for r in sales_gc if r["name"].startswith("Ola"))
     assert ola["name"] == "Ola O'Neil"
     assert isinstance(ola["active"], bool) and ola["active"] is True
@@ -85,14 +85,14 @@ def test_sql_backup_multiline_and_edge_cases(tmp_path):
     path.write_text(sql)
 
     inp = SQLBackupInput(str(path))
-    tables = {(t["schema"], t["name"]): t for t in inp.get_tables()}
+    tables = {(t["schema"], t["name"]): list(t["rows"]) for t in inp.get_tables()}
 
-    sample_rows = tables[("sch", "sample")]["rows"]
+    sample_rows = tables[("sch", "sample")]
     ids = sorted(r["id"] for r in sample_rows)
     # Only the single-line INSERT with id 11 should be captured; id 10 multiline ignored; id 12 incomplete ignored
     assert ids == [11]
 
-    pre_rows = tables[("sch", "pre")]["rows"]
+    pre_rows = tables[("sch", "pre")]
     assert pre_rows == [{"id": 1, "name": "a"}]
 
     flat = list(inp.iter_rows())
@@ -19,7 +19,7 @@ def test_sql_backup_single_line_create_and_constraint_and_dedupe(tmp_path):
     p.write_text(sql)
 
     inp = SQLBackupInput(str(p))
-    tables = {(t['schema'], t['name']): t for t in inp.get_tables()}
+    tables = {(t['schema'], t['name']): dict(t, rows=list(t['rows'])) for t in inp.get_tables()}
 
     # ct table columns (constraint removed, numeric type kept)
     ct = tables[('s','ct')]
@@ -30,3 +30,40 @@ def test_sqlite_iter_rows_full_coverage():
     # Ensure view rows present (at least one duplicate name from customers)
     customer_names = [r.get("name") for r in rows if "name" in r]
     assert customer_names.count("Alice") >= 1
+
+
+def test_sqlite_iter_rows_streams_in_yield_per_batches():
+    si = SQLiteInput("sqlite:///:memory:", yield_per=2)
+    conn = si.connection
+    conn.execute(text("CREATE TABLE t(id INTEGER PRIMARY KEY)"))
+    conn.execute(text("INSERT INTO t(id) VALUES (1), (2), (3), (4), (5)"))
+    conn.commit()
+    si.inspector = inspect(si.engine)
+    result = si._stream(text("SELECT id FROM t ORDER BY id"))
+    assert result.context.execution_options["yield_per"] == 2
+    result.close()
+    assert [r["id"] for r in si.iter_rows()] == [1, 2, 3, 4, 5]
+
+
+def test_sqlite_iter_rows_reflects_included_tables_once():
+    si = SQLiteInput("sqlite:///:memory:", include=["a"])
+    conn = si.connection
+    conn.execute(text("CREATE TABLE a(id INTEGER PRIMARY KEY)"))
+    conn.execute(text("CREATE TABLE b(id INTEGER PRIMARY KEY)"))
+    conn.execute(text("INSERT INTO a(id) VALUES (1), (2)"))
+    conn.execute(text("INSERT INTO b(id) VALUES (3)"))
+    conn.commit()
+    si.inspector = inspect(si.engine)
+    reflected = []
+    original = si.metadata.reflect
+
+    def counting_reflect(*args, **kwargs):
+        reflected.append(kwargs.get("only"))
+        return original(*args, **kwargs)
+
+    si.metadata.reflect = counting_reflect
+    assert [r["id"] for r in si.iter_rows()] == [1, 2]
+    assert [r["id"] for r in si.iter_rows()] == [1, 2]
+    # excluded tables are never reflected; included ones only on the first call
+    assert reflected == [["a"]]
+    assert list(si.metadata.tables) == ["a"]
@@ -66,3 +66,129 @@ def test_flush_with_empty_rows_list_continue_branch(tmp_path):
     assert (outdir / "real_table.parquet").exists()
     assert not (outdir / "empty_table.parquet").exists()
     pqout.close()
+
+
+@pytest.mark.parametrize("mode", ["vectorized", "chunked"])
+def test_write_batch_counts_skips_and_writes_string_schema(tmp_path, mode):
+    import polars as pl
+    import pyarrow as pa
+    outdir = tmp_path / f"batch_{mode}"
+    pqout = PQOutput(dest=str(outdir), schema=None, mode=mode, chunk_size=2)
+    pqout.open()
+    batch = pl.DataFrame({
+        "id": [1, 2, 3],
+        "name": ["a", "b", "c"],
+        "_table": ["t1", "t1", "t1"],
+        "__forklift_skip__": [False, True, False],
+    })
+    pqout.write_batch(batch)
+    pqout.write_batch(batch.head(1))
+    pqout.close()
+    assert pqout.counters == {"read": 4, "kept": 3, "rejected": 0}
+    table = pq.read_table(outdir / "t1.parquet")
+    assert table.column("id").to_pylist() == [1, 3, 1]
+    assert table.schema.field("name").type == pa.string()
+    assert "__forklift_skip__" not in table.schema.names
+
+
+@pytest.mark.parametrize("mode", ["vectorized", "chunked"])
+def test_zstd_and_forced_dictionary_columns(tmp_path, mode):
+    schema = {"properties": {"status": {"type": "string", "enum": ["a", "b"]}}}
+    outdir = tmp_path / mode
+    pqout = PQOutput(dest=str(outdir), schema=schema, mode=mode, chunk_size=2, use_dictionary=False)
+    assert pqout.use_dictionary == ["_table", "status"]
+    pqout.open()
+    for i in range(4):
+        pqout.write({"_table": "t", "id": i, "status": "ab"[i % 2]})
+    pqout.close()
+    meta = pq.ParquetFile(outdir / "t.parquet").metadata
+    columns = {meta.row_group(0).column(i).path_in_schema: meta.row_group(0).column(i) for i in range(meta.num_columns)}
+    assert columns["id"].compression == "ZSTD"
+    assert any("DICTIONARY" in enc for enc in columns["status"].encodings)
+    assert not any("DICTIONARY" in enc for enc in columns["id"].encodings)
+
+
+def test_chunked_mode_coalesces_chunks_into_full_row_groups(tmp_path):
+    import polars as pl
+    outdir = tmp_path / "groups"
+    pqout = PQOutput(dest=str(outdir), schema=None, mode="chunked", row_group_size=5, write_batch_size=2)
+    pqout.open()
+    for start in range(0, 12, 3):
+        pqout.write_batch(pl.DataFrame({"id": list(range(start, start + 3)), "_table": ["t"] * 3}))
+    pqout.close()
+    pf = pq.ParquetFile(outdir / "t.parquet")
+    assert [pf.metadata.row_group(i).num_rows for i in range(pf.metadata.num_row_groups)] == [5, 5, 2]
+    assert pf.read().column("id").to_pylist() == list(range(12))
+
+
+def test_compression_level_rejected_for_snappy(tmp_path):
+    with pytest.raises(ValueError):
+        PQOutput(dest=str(tmp_path), compression="snappy", compression_level=1)
+
+
+@pytest.mark.parametrize("mode", ["vectorized", "chunked"])
+def test_write_batch_uses_declared_decimal_precision(tmp_path, mode):
+    from decimal import Decimal
+    import polars as pl
+    import pyarrow as pa
+    schema = {"properties": {
+        "price": {"type": "decimal", "precision": 9, "scale": 2},
+        "big": {"type": "decimal", "precision": 5, "scale": 2},
+    }}
+    outdir = tmp_path / mode
+    pqout = PQOutput(dest=str(outdir), schema=schema, mode=mode)
+    pqout.open()
+    pqout.write_batch(pl.DataFrame(
+        {"price": [Decimal("19.99"), None], "big": [Decimal("123456.78"), Decimal("1")], "_table": ["t", "t"]},
+        schema={"price": pl.Decimal(38, 2), "big": pl.Decimal(38, 2), "_table": pl.Utf8},
+    ))
+    pqout.close()
+    table = pq.read_table(outdir / "t.parquet")
+    # Polars decimals are always precision 38; the schema's precision wins
+    assert table.schema.field("price").type == pa.decimal128(9, 2)
+    # a value wider than the declared precision keeps the column at 38 instead of failing
+    assert table.schema.field("big").type == pa.decimal128(38, 2)
+    assert table.column("price").to_pylist() == [Decimal("19.99"), None]
+
+
+def test_engine_ingest_keeps_declared_decimal_types(tmp_path):
+    import pyarrow as pa
+    from forklift.engine.engine import Engine
+    src = tmp_path / "d.csv"
+    src.write_text("id,amount,rate\n1,12.5,0.000001\n2,1234.56,3.25\n", encoding="utf-8")
+    schema = {"properties": {
+        "id": {"type": "integer"},
+        "amount": {"type": "decimal", "precision": 9, "scale": 2},
+        "rate": {"type": "decimal", "precision": 18, "scale": 6},
+    }}
+    eng = Engine(input_kind="csv", output_kind="parquet", schema=schema, preprocessors=["type_coercion"],
+                 delimiter=",", encoding_priority=["utf-8"], header_mode="auto")
+    eng.run(str(src), str(tmp_path / "out"))
+    out_schema = pq.read_schema(tmp_path / "out" / "d.csv.parquet")
+    assert out_schema.field("amount").type == pa.decimal128(9, 2)
+    assert out_schema.field("rate").type == pa.decimal128(18, 6)
+
+
+def test_chunked_mode_writes_before_close_once_chunk_size_is_pending(tmp_path):
+    import polars as pl
+    outdir = tmp_path / "bounded"
+    pqout = PQOutput(dest=str(outdir), schema=None, mode="chunked", chunk_size=4)
+    pqout.open()
+    for start in range(0, 9, 3):
+        pqout.write_batch(pl.DataFrame({"id": list(range(start, start + 3)), "_table": ["t"] * 3}))
+    # 6 rows reached the cap and were written; only the last 3 are still queued
+    assert "t" in pqout._writers
+    assert pqout._pending_rows == {"t": 3}
+    pqout.close()
+    pf = pq.ParquetFile(outdir / "t.parquet")
+    assert [pf.metadata.row_group(i).num_rows for i in range(pf.metadata.num_row_groups)] == [6, 3]
+    assert pf.read().column("id").to_pylist() == list(range(9))
+
+
+def test_chunked_mode_schema_mismatch_names_table(tmp_path):
+    import polars as pl
+    pqout = PQOutput(dest=str(tmp_path / "mismatch"), schema=None, mode="chunked", chunk_size=1)
+    pqout.open()
+    pqout.write_batch(pl.DataFrame({"id": [1], "_table": ["orders"]}))
+    with pytest.raises(ValueError, match="'orders'"):
+        pqout.write_batch(pl.DataFrame({"code": ["x"], "_table": ["orders"]}))
@@ -23,3 +23,12 @@ def test_type_coercion_vectorized_happy_and_errors():
     # Errors captured
     assert hasattr(tc, "_df_errors")
     assert len(tc._df_errors) == 1
+
+def test_type_coercion_string_columns_blank_and_null_tokens_vectorized():
+    tc = TypeCoercion(types={"amount": {"type": "number"}, "d": {"type": "string", "format": "date"}},
+                      nulls={"amount": ["N/A"]})
+    df = pl.DataFrame({"amount": ["1", "  ", "N/A", "bad", "2"], "d": ["2024-01-01", None, "2024-01-02", "2024-01-03", "nope"]})
+    out = tc.process_dataframe(df)
+    assert out.get_column("amount").to_list() == [1.0, None, None]
+    # failing rows are reported as their original raw values, in input order
+    assert [r for r, _ in tc._df_errors] == [{"amount": "bad", "d": "2024-01-03"}, {"amount": "2", "d": "nope"}]
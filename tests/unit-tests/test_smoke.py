@@ -1,2 +1,12 @@
 def test_import():
-    import forklift  # noqa: F401
\ No newline at end of file
+    import forklift  # noqa: F401
+
+def test_row_result_is_slotted_and_frozen():
+    import dataclasses
+    import pytest
+    from forklift.types import RowResult
+
+    rr = RowResult(row={"id": 1}, error=None)
+    assert not hasattr(rr, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        rr.row = {}  # type: ignore[misc]
@@ -11,3 +11,14 @@ def test_open_text_auto_fallback(tmp_path: Path):
         assert fh.read() == "hello"
     finally:
         fh.close()
+
+
+def test_open_text_auto_buffering(tmp_path: Path):
+    p = tmp_path / "g.txt"
+    p.write_text("a\nb\n", encoding="utf-8")
+    fh = open_text_auto(str(p), buffering=1 << 16)
+    try:
+        assert fh.readline() == "a\n"
+        assert fh.read() == "b\n"
+    finally:
+        fh.close()